@@ -10,161 +10,312 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
+import platform
+import subprocess
 import sys
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Callable
 
 # Add the src directory to the path so we can import the package directly
-# when running from the repository root without installing.
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+# when running from the repository root without installing.  Installed
+# (including editable) copies are used as-is.
+try:
+    import davinci_resolve_mcp  # noqa: F401
+except ImportError:
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
 
-from davinci_resolve_mcp.resolve_api import ResolveAPI
-from davinci_resolve_mcp.exceptions import ResolveNotRunning
+if TYPE_CHECKING:
+    from davinci_resolve_mcp.resolve_api import ResolveAPI
 
 
-def _separator() -> None:
-    """Print a visual separator line."""
-    print("-" * 50)
+_SEPARATOR = "-" * 50
 
+# How many project names / volumes to list before summarising the rest
+_MAX_PROJECTS_SHOWN = 10
+_MAX_VOLUMES_SHOWN = 5
 
-def main() -> int:
+# Cheap per-platform process probes, run before the package and the
+# Resolve scripting library are loaded.
+_PROCESS_PROBES: dict[str, tuple[list[str], str | None]] = {
+    "Darwin": (["pgrep", "-x", "Resolve"], None),
+    "Linux": (["pgrep", "-x", "resolve"], None),
+    "Windows": (["tasklist", "/FI", "IMAGENAME eq Resolve.exe", "/NH"], "Resolve.exe"),
+}
+
+
+def _resolve_process_running() -> bool | None:
+    """Check whether a Resolve process exists without touching the bridge.
+
+    Returns:
+        True or False when the probe gave a definite answer, None when it
+        could not run (unknown platform, missing tool, timeout).  Callers
+        should only fail fast on False.
+    """
+    probe = _PROCESS_PROBES.get(platform.system())
+    if probe is None:
+        return None
+    cmd, marker = probe
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=2)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if marker is not None:
+        # tasklist exits 0 either way; look for the image name in its output
+        return marker.lower() in result.stdout.lower()
+    if result.returncode > 1:
+        # pgrep: 0 = match, 1 = no match, anything else = probe error
+        return None
+    return result.returncode == 0
+
+
+def _flush(out: list[str]) -> None:
+    """Write buffered report lines to stdout in one call and clear the buffer."""
+    sys.stdout.write("\n".join(out) + "\n")
+    sys.stdout.flush()
+    out.clear()
+
+
+async def _gather(*calls: Callable[[], Any]) -> list[Any]:
+    """Run independent blocking Resolve calls concurrently in worker threads.
+
+    Each call is an IPC round-trip into Resolve, so overlapping them cuts the
+    wall time of a group to roughly its slowest call.  Exceptions are
+    returned in place of results so every check can report its own failure.
+    """
+    return await asyncio.gather(
+        *(asyncio.to_thread(call) for call in calls),
+        return_exceptions=True,
+    )
+
+
+def _read_settings(project: Any, keys: tuple[str, ...]) -> list[Any]:
+    """Read several project settings with as few round-trips as possible.
+
+    ``GetSetting()`` with no argument returns every setting as a dict in a
+    single IPC call.  Older bridges that reject the no-arg form fall back
+    to one ``GetSetting(key)`` call per key.
+    """
+    try:
+        settings = project.GetSetting()
+    except Exception:
+        settings = None
+    if isinstance(settings, dict):
+        return [settings.get(key) for key in keys]
+    return [project.GetSetting(key) for key in keys]
+
+
+def _handle(api: ResolveAPI, attr: str) -> Any:
+    """Resolve one API handle, returning the exception instead of raising it."""
+    try:
+        return getattr(api, attr)
+    except Exception as exc:
+        return exc
+
+
+async def amain() -> int:
     """Run all connection checks and print results.
 
     Returns:
         0 if all checks passed, 1 if any check failed.
     """
-    print()
-    print("DaVinci Resolve MCP - Connection Check")
-    _separator()
+    # Collect the report and write it once; error exits flush first.
+    out: list[str] = []
+    p = out.append
+
+    p("")
+    p("DaVinci Resolve MCP - Connection Check")
+    p(_SEPARATOR)
 
     # ------------------------------------------------------------------
     # 1. Connect to Resolve
     # ------------------------------------------------------------------
+    # Fail fast when no Resolve process exists: importing the package and
+    # locating/loading the scripting library is the slowest part of startup.
+    if _resolve_process_running() is False:
+        p("\u274c Connection failed: no DaVinci Resolve process found.")
+        p("")
+        p("Make sure DaVinci Resolve is running and try again.")
+        _flush(out)
+        return 1
+
+    from davinci_resolve_mcp.exceptions import ResolveNotRunning
+    from davinci_resolve_mcp.resolve_api import ResolveAPI
+
     try:
         api = ResolveAPI.get_instance()
         resolve = api.resolve
     except ResolveNotRunning as exc:
-        print(f"\u274c Connection failed: {exc}")
-        print()
-        print("Make sure DaVinci Resolve is running and try again.")
+        p(f"\u274c Connection failed: {exc}")
+        p("")
+        p("Make sure DaVinci Resolve is running and try again.")
+        _flush(out)
         return 1
     except Exception as exc:
-        print(f"\u274c Unexpected error: {exc}")
+        p(f"\u274c Unexpected error: {exc}")
+        _flush(out)
         return 1
 
-    print("\u2705 Connected to DaVinci Resolve")
+    p("\u2705 Connected to DaVinci Resolve")
+
+    # Each handle property re-validates the connection and walks the object
+    # chain, so resolve them once here and reuse the locals below.
+    pm, project, timeline, storage = (
+        _handle(api, attr)
+        for attr in ("project_manager", "project", "timeline", "media_storage")
+    )
 
     # ------------------------------------------------------------------
-    # 2. Version and product info
+    # 2. Version, product info and current page (one concurrent group)
     # ------------------------------------------------------------------
-    try:
-        raw_version = resolve.GetVersion()
+    raw_version, product, page = await _gather(
+        resolve.GetVersion, resolve.GetProductName, resolve.GetCurrentPage,
+    )
+
+    if isinstance(raw_version, Exception):
+        p(f"\u274c Could not read version: {raw_version}")
+    else:
         if isinstance(raw_version, (list, tuple)):
             version = ".".join(str(v) for v in raw_version)
         else:
             version = str(raw_version)
-        print(f"\u2705 Version: {version}")
-    except Exception as exc:
-        print(f"\u274c Could not read version: {exc}")
+        p(f"\u2705 Version: {version}")
 
-    try:
-        product = resolve.GetProductName()
-        print(f"\u2705 Product: {product}")
-    except Exception as exc:
-        print(f"\u274c Could not read product name: {exc}")
+    if isinstance(product, Exception):
+        p(f"\u274c Could not read product name: {product}")
+    else:
+        p(f"\u2705 Product: {product}")
 
     # ------------------------------------------------------------------
     # 3. Current page
     # ------------------------------------------------------------------
-    try:
-        page = resolve.GetCurrentPage() or "(unknown)"
-        print(f"\u2705 Current page: {page}")
-    except Exception as exc:
-        print(f"\u274c Could not read current page: {exc}")
+    if isinstance(page, Exception):
+        p(f"\u274c Could not read current page: {page}")
+    else:
+        p(f"\u2705 Current page: {page or '(unknown)'}")
 
-    _separator()
+    p(_SEPARATOR)
 
     # ------------------------------------------------------------------
     # 4. Project manager and project list
     # ------------------------------------------------------------------
     try:
-        pm = api.project_manager
+        if isinstance(pm, Exception):
+            raise pm
         projects = pm.GetProjectListInCurrentFolder() or []
-        print(f"\u2705 Projects in current folder: {len(projects)}")
-        # Show up to 10 project names
-        for name in projects[:10]:
-            print(f"   - {name}")
-        if len(projects) > 10:
-            print(f"   ... and {len(projects) - 10} more")
+        p(f"\u2705 Projects in current folder: {len(projects)}")
+        # Show the first few project names
+        for name in islice(projects, _MAX_PROJECTS_SHOWN):
+            p(f"   - {name}")
+        if len(projects) > _MAX_PROJECTS_SHOWN:
+            p(f"   ... and {len(projects) - _MAX_PROJECTS_SHOWN} more")
     except Exception as exc:
-        print(f"\u274c Could not list projects: {exc}")
+        p(f"\u274c Could not list projects: {exc}")
 
-    _separator()
+    p(_SEPARATOR)
 
     # ------------------------------------------------------------------
-    # 5. Current project info
+    # 5. Current project info (one concurrent group)
     # ------------------------------------------------------------------
     try:
-        project = api.project
+        if isinstance(project, Exception):
+            raise project
         if project is None:
-            print("\u26a0\ufe0f  No project is currently open.")
+            p("\u26a0\ufe0f  No project is currently open.")
         else:
-            print(f"\u2705 Current project: {project.GetName()}")
-            timeline_count = project.GetTimelineCount() or 0
-            print(f"\u2705 Timelines: {timeline_count}")
-
-            # Read key settings
-            width = project.GetSetting("timelineResolutionWidth") or "?"
-            height = project.GetSetting("timelineResolutionHeight") or "?"
-            fps = project.GetSetting("timelineFrameRate") or "?"
-            print(f"\u2705 Resolution: {width}x{height} @ {fps} fps")
+            results = await _gather(
+                project.GetName,
+                project.GetTimelineCount,
+                lambda: _read_settings(project, (
+                    "timelineResolutionWidth",
+                    "timelineResolutionHeight",
+                    "timelineFrameRate",
+                )),
+            )
+            # Report each read on its own so one failure doesn't hide the rest
+            name, timeline_count, settings = results
+            if isinstance(name, Exception):
+                p(f"\u274c Could not read project name: {name}")
+            else:
+                p(f"\u2705 Current project: {name}")
+            if isinstance(timeline_count, Exception):
+                p(f"\u274c Could not read timeline count: {timeline_count}")
+            else:
+                p(f"\u2705 Timelines: {timeline_count or 0}")
+            if isinstance(settings, Exception):
+                p(f"\u274c Could not read project settings: {settings}")
+            else:
+                width, height, fps = settings
+                p(f"\u2705 Resolution: {width or '?'}x{height or '?'} @ {fps or '?'} fps")
     except Exception as exc:
-        print(f"\u274c Could not read project info: {exc}")
+        p(f"\u274c Could not read project info: {exc}")
 
-    _separator()
+    p(_SEPARATOR)
 
     # ------------------------------------------------------------------
-    # 6. Current timeline info
+    # 6. Current timeline info (one concurrent group)
     # ------------------------------------------------------------------
     try:
-        timeline = api.timeline
+        if isinstance(timeline, Exception):
+            raise timeline
         if timeline is None:
-            print("\u26a0\ufe0f  No timeline is currently open.")
+            p("\u26a0\ufe0f  No timeline is currently open.")
         else:
-            print(f"\u2705 Current timeline: {timeline.GetName()}")
-            print(f"\u2705 Start frame: {timeline.GetStartFrame()}")
-            print(f"\u2705 End frame: {timeline.GetEndFrame()}")
-            video_tracks = timeline.GetTrackCount("video") or 0
-            audio_tracks = timeline.GetTrackCount("audio") or 0
-            print(f"\u2705 Tracks: {video_tracks} video, {audio_tracks} audio")
-            timecode = timeline.GetCurrentTimecode() or "(unknown)"
-            print(f"\u2705 Playhead: {timecode}")
+            results = await _gather(
+                timeline.GetName,
+                timeline.GetStartFrame,
+                timeline.GetEndFrame,
+                lambda: timeline.GetTrackCount("video"),
+                lambda: timeline.GetTrackCount("audio"),
+                timeline.GetCurrentTimecode,
+            )
+            # Unreadable fields show as "?" instead of failing the section
+            name, start, end, video_tracks, audio_tracks, timecode = (
+                "?" if isinstance(r, Exception) else r for r in results
+            )
+            errors = [r for r in results if isinstance(r, Exception)]
+            p(f"\u2705 Current timeline: {name}")
+            p(f"\u2705 Start frame: {start}")
+            p(f"\u2705 End frame: {end}")
+            p(f"\u2705 Tracks: {video_tracks or 0} video, {audio_tracks or 0} audio")
+            p(f"\u2705 Playhead: {timecode or '(unknown)'}")
+            if errors:
+                p(f"\u274c Could not read {len(errors)} timeline field(s): {errors[0]}")
     except Exception as exc:
-        print(f"\u274c Could not read timeline info: {exc}")
+        p(f"\u274c Could not read timeline info: {exc}")
 
-    _separator()
+    p(_SEPARATOR)
 
     # ------------------------------------------------------------------
     # 7. Media storage check
     # ------------------------------------------------------------------
     try:
-        storage = api.media_storage
+        if isinstance(storage, Exception):
+            raise storage
         if storage is None:
-            print("\u26a0\ufe0f  Media Storage is not available.")
+            p("\u26a0\ufe0f  Media Storage is not available.")
         else:
             volumes = storage.GetMountedVolumeList() or []
-            print(f"\u2705 Mounted volumes: {len(volumes)}")
-            for vol in volumes[:5]:
-                print(f"   - {vol}")
-            if len(volumes) > 5:
-                print(f"   ... and {len(volumes) - 5} more")
+            p(f"\u2705 Mounted volumes: {len(volumes)}")
+            for vol in islice(volumes, _MAX_VOLUMES_SHOWN):
+                p(f"   - {vol}")
+            if len(volumes) > _MAX_VOLUMES_SHOWN:
+                p(f"   ... and {len(volumes) - _MAX_VOLUMES_SHOWN} more")
     except Exception as exc:
-        print(f"\u274c Could not read media storage: {exc}")
+        p(f"\u274c Could not read media storage: {exc}")
 
-    _separator()
-    print("\u2705 All checks complete.")
-    print()
+    p(_SEPARATOR)
+    p("\u2705 All checks complete.")
+    p("")
+    _flush(out)
     return 0
 
 
+def main() -> int:
+    """Synchronous entry point wrapping :func:`amain`."""
+    return asyncio.run(amain())
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -1,10 +1,12 @@
 #!/usr/bin/env python3
 """Auto-generate docs/TOOLS.md from the registered MCP tools.
 
-Creates a FastMCP instance per domain, registers each tool module, then
-uses the async list_tools() API to extract every tool's name, description,
+Registers each tool module on a single FastMCP instance, one domain at a time,
+and uses the async list_tools() API to extract every tool's name, description,
 input schema, and annotations.  The output is a markdown file grouped by
-domain, written to docs/TOOLS.md.
+domain, written to docs/TOOLS.md.  A ``<!-- toolhash: ... -->`` comment on
+the first line records what was generated; when the hash still matches, the
+file is left untouched.
 
 Usage:
     python scripts/generate_tool_docs.py
@@ -16,49 +18,71 @@ inspects the tool registration metadata, not the Resolve API itself.
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import importlib
+import io
 import json
+import os
 import sys
+import tempfile
 from datetime import datetime, timezone
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
-# Add the src directory to the path so we can import without installing
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
-
-from davinci_resolve_mcp.tools import (
-    playback,
-    project,
-    media_storage,
-    media_pool,
-    media_pool_item,
-    timeline,
-    timeline_item,
-    render,
-    color,
-    fusion,
-    gallery,
-    fairlight,
-)
+# Add the src directory to the path so we can import without installing;
+# installed (including editable) copies are used as-is.
+try:
+    import davinci_resolve_mcp  # noqa: F401
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
 from fastmcp import FastMCP
 
 
 # ---------------------------------------------------------------------------
-# Domain metadata: maps module to a human-readable domain name and description
+# Domain metadata: (name, TOC anchor slug, description, module path)
 # ---------------------------------------------------------------------------
-_DOMAIN_ORDER: list[tuple[str, str, Any]] = [
-    ("Playback", "Page navigation, timecode, playhead, version info", playback),
-    ("Project", "Project CRUD, settings, import/export, database folders, archive/restore", project),
-    ("Media Storage", "Browse volumes, list files, import to media pool", media_storage),
-    ("Media Pool", "Folder CRUD, clip management, timeline creation, metadata", media_pool),
-    ("Clips (Media Pool Item)", "Clip metadata, properties, colors, markers, flags, proxy, transcription", media_pool_item),
-    ("Timeline", "Timeline CRUD, tracks, items, markers, export, compound/Fusion clips, settings", timeline),
-    ("Timeline Items", "Transform, crop, composite, color labels, markers, flags, takes, stabilize", timeline_item),
-    ("Render", "Formats, codecs, presets, job queue, rendering, progress", render),
-    ("Color", "Nodes, LUTs, CDL, grade versions, DRX, color groups, node labels", color),
-    ("Fusion", "Compositions CRUD, generators, titles, tool listing", fusion),
-    ("Gallery", "Still albums, grab/import/export stills, PowerGrades", gallery),
-    ("Fairlight", "Audio insertion, presets listing, preset application", fairlight),
-]
+# The anchor is the GitHub heading slug of the name, precomputed here.  Tool
+# modules are referenced by dotted path and imported only when their domain
+# is processed, so none of them load at script import time.
+_TOOLS_PACKAGE = "davinci_resolve_mcp.tools"
+
+_DOMAIN_ORDER: tuple[tuple[str, str, str, str], ...] = (
+    ("Playback", "playback", "Page navigation, timecode, playhead, version info", f"{_TOOLS_PACKAGE}.playback"),
+    ("Project", "project", "Project CRUD, settings, import/export, database folders, archive/restore", f"{_TOOLS_PACKAGE}.project"),
+    ("Media Storage", "media-storage", "Browse volumes, list files, import to media pool", f"{_TOOLS_PACKAGE}.media_storage"),
+    ("Media Pool", "media-pool", "Folder CRUD, clip management, timeline creation, metadata", f"{_TOOLS_PACKAGE}.media_pool"),
+    ("Clips (Media Pool Item)", "clips-media-pool-item", "Clip metadata, properties, colors, markers, flags, proxy, transcription", f"{_TOOLS_PACKAGE}.media_pool_item"),
+    ("Timeline", "timeline", "Timeline CRUD, tracks, items, markers, export, compound/Fusion clips, settings", f"{_TOOLS_PACKAGE}.timeline"),
+    ("Timeline Items", "timeline-items", "Transform, crop, composite, color labels, markers, flags, takes, stabilize", f"{_TOOLS_PACKAGE}.timeline_item"),
+    ("Render", "render", "Formats, codecs, presets, job queue, rendering, progress", f"{_TOOLS_PACKAGE}.render"),
+    ("Color", "color", "Nodes, LUTs, CDL, grade summary, grade versions, DRX, color groups, node labels", f"{_TOOLS_PACKAGE}.color"),
+    ("Fusion", "fusion", "Compositions CRUD, generators and titles (single and batch), tool listing", f"{_TOOLS_PACKAGE}.fusion"),
+    ("Gallery", "gallery", "Still albums, grab/import/export stills, PowerGrades", f"{_TOOLS_PACKAGE}.gallery"),
+    ("Fairlight", "fairlight", "Audio insertion (single and batch), presets listing, preset application", f"{_TOOLS_PACKAGE}.fairlight"),
+)
+
+
+# Parameter table pieces, formatted with % for a uniform row template
+_TABLE_HEADER = (
+    "\n| Parameter | Type | Default | Description |\n"
+    "|-----------|------|---------|-------------|\n"
+)
+_ROW = "| `%s` | `%s` | %s | %s |"
+_ROW_FIELDS = itemgetter("name", "type", "default", "description")
+
+
+def _freeze(schema: Any) -> str:
+    """Return a hashable, canonical key for a JSON Schema fragment."""
+    return json.dumps(schema, sort_keys=True, default=str)
+
+
+@lru_cache(maxsize=2048)
+def _format_type_cached(frozen: str) -> str:
+    """Memoised _format_type() — many tools share identical parameter shapes."""
+    return _format_type(json.loads(frozen))
 
 
 def _format_type(schema_prop: dict) -> str:
@@ -85,16 +109,32 @@ def _format_type(schema_prop: dict) -> str:
     return prop_type
 
 
+# Interned _extract_params() results: tools with identical parameter schemas
+# share one list.  Treat the returned lists as read-only.
+_param_cache: dict[tuple, list[dict]] = {}
+
+
 def _extract_params(input_schema: dict) -> list[dict]:
     """Extract parameter info from a JSON Schema input_schema."""
     properties = input_schema.get("properties", {})
     required = set(input_schema.get("required", []))
+
+    # Property order is kept in the key because it is the table row order
+    frozen_props = tuple((name, _freeze(prop)) for name, prop in properties.items())
+    key = (frozen_props, tuple(sorted(required)))
+    cached = _param_cache.get(key)
+    if cached is not None:
+        return cached
+
     params = []
 
-    for name, prop in properties.items():
-        type_str = _format_type(prop)
+    for name, frozen in frozen_props:
+        prop = properties[name]
+        type_str = _format_type_cached(frozen)
         default = "*required*" if name in required else f"`{prop.get('default', 'None')!r}`"
-        description = prop.get("description", "")
+        # Escaped once here so rows can be formatted without per-cell work.
+        # Multi-line Args entries are joined so they stay in one table row.
+        description = " ".join(prop.get("description", "").split()).replace("|", "\\|")
         params.append({
             "name": name,
             "type": type_str,
@@ -102,17 +142,24 @@ def _extract_params(input_schema: dict) -> list[dict]:
             "description": description,
         })
 
+    _param_cache[key] = params
     return params
 
 
-async def _collect_domain_tools(domain_name: str, module: Any) -> list[dict]:
-    """Register a module on a fresh FastMCP and extract its tools via list_tools()."""
-    temp_mcp = FastMCP(f"temp-{domain_name}")
-    module.register(temp_mcp)
+async def _collect_domain_tools(
+    mcp: FastMCP, module_path: str, seen: set[str]
+) -> list[dict]:
+    """Register a module on the shared FastMCP and extract only its new tools.
+
+    Every domain registers on the same server, so the tools belonging to
+    *module_path* are the ones list_tools() reports that are not yet in *seen*.
+    """
+    importlib.import_module(module_path).register(mcp)
 
     # list_tools() returns FunctionTool objects with .name, .description,
     # .parameters (JSON Schema dict), .annotations (ToolAnnotations)
-    tools = await temp_mcp.list_tools()
+    tools = [t for t in await mcp.list_tools() if t.name not in seen]
+    seen.update(t.name for t in tools)
     tools_info = []
 
     for tool in tools:
@@ -142,74 +189,103 @@ async def _collect_domain_tools(domain_name: str, module: Any) -> list[dict]:
 async def async_main() -> None:
     """Generate docs/TOOLS.md from the registered MCP tools."""
 
-    # Collect tools per domain (each in its own FastMCP instance for isolation)
-    domain_tools: list[tuple[str, str, list[dict]]] = []
+    # Register every domain on one shared FastMCP, in order, and attribute
+    # each newly listed tool to the domain that just registered it.
+    mcp = FastMCP("doc-gen")
+    seen: set[str] = set()
+    domain_tools: list[tuple[str, str, str, list[dict]]] = []
 
-    for domain_name, domain_desc, module in _DOMAIN_ORDER:
-        tools = await _collect_domain_tools(domain_name, module)
-        domain_tools.append((domain_name, domain_desc, tools))
+    for domain_name, anchor, domain_desc, module_path in _DOMAIN_ORDER:
+        tools = await _collect_domain_tools(mcp, module_path, seen)
+        domain_tools.append((domain_name, anchor, domain_desc, tools))
 
     # ------------------------------------------------------------------
-    # Generate the markdown output
+    # Skip regeneration when nothing changed
     # ------------------------------------------------------------------
+    # The hash covers the collected tool metadata plus this script's own
+    # source, so formatting changes here also trigger a rewrite.  The
+    # timestamp line is deliberately left out.
     output_path = Path(__file__).resolve().parent.parent / "docs" / "TOOLS.md"
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(json.dumps(domain_tools, sort_keys=True, default=str).encode())
+    hasher.update(Path(__file__).read_bytes())
+    hash_header = f"<!-- toolhash: {hasher.hexdigest()} -->\n"
+
+    if output_path.exists():
+        with output_path.open("rb") as f:
+            if f.read(200).startswith(hash_header.encode()):
+                print(f"{output_path} is up to date.")
+                return
+
+    # ------------------------------------------------------------------
+    # Generate the markdown output
+    # ------------------------------------------------------------------
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    total_tools = sum(len(tools) for _, _, tools in domain_tools)
+    total_tools = sum(len(tools) for *_, tools in domain_tools)
     now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
 
-    lines: list[str] = []
-    lines.append("# Tool Reference")
-    lines.append("")
-    lines.append(f"Auto-generated on {now} by `scripts/generate_tool_docs.py`.")
-    lines.append("")
-    lines.append(f"**{total_tools} tools** across **{len(domain_tools)} domains**.")
-    lines.append("")
+    # Stream everything into one buffer rather than building a list of lines
+    # and joining it.  Blank separator lines are written *before* each block
+    # so the file ends with exactly one newline.
+    buf = io.StringIO()
+    write = buf.write
+    write(hash_header)
+    write("# Tool Reference\n\n")
+    write(f"Auto-generated on {now} by `scripts/generate_tool_docs.py`.\n\n")
+    write(f"**{total_tools} tools** across **{len(domain_tools)} domains**.\n\n")
 
     # Table of contents
-    lines.append("## Table of Contents")
-    lines.append("")
-    for domain_name, _desc, tools in domain_tools:
-        anchor = domain_name.lower().replace(" ", "-").replace("(", "").replace(")", "")
-        lines.append(f"- [{domain_name}](#{anchor}) ({len(tools)} tools)")
-    lines.append("")
+    write("## Table of Contents\n\n")
+    for domain_name, anchor, _desc, tools in domain_tools:
+        write(f"- [{domain_name}](#{anchor}) ({len(tools)} tools)\n")
 
     # One section per domain
-    for domain_name, domain_desc, tools in domain_tools:
-        lines.append(f"## {domain_name}")
-        lines.append("")
-        lines.append(f"*{domain_desc}*")
-        lines.append("")
+    for domain_name, _anchor, domain_desc, tools in domain_tools:
+        write(f"\n## {domain_name}\n\n*{domain_desc}*\n")
 
         if not tools:
-            lines.append("*No tools registered for this domain.*")
-            lines.append("")
+            write("\n*No tools registered for this domain.*\n")
             continue
 
         for tool in tools:
             # Tool header with optional read-only badge
             ro_badge = " `read-only`" if tool["read_only"] else ""
-            lines.append(f"### `{tool['name']}`{ro_badge}")
-            lines.append("")
-            lines.append(tool["description"])
-            lines.append("")
+            write(f"\n### `{tool['name']}`{ro_badge}\n\n{tool['description']}\n")
 
             # Parameters table
             if tool["parameters"]:
-                lines.append("| Parameter | Type | Default | Description |")
-                lines.append("|-----------|------|---------|-------------|")
-                for p in tool["parameters"]:
-                    desc = p["description"].replace("|", "\\|")  # Escape pipes
-                    lines.append(f"| `{p['name']}` | `{p['type']}` | {p['default']} | {desc} |")
-                lines.append("")
-
-    # Write the file
-    output_path.write_text("\n".join(lines), encoding="utf-8")
+                rows = "\n".join(map(_ROW.__mod__, map(_ROW_FIELDS, tool["parameters"])))
+                write(_TABLE_HEADER)
+                write(rows + "\n")
+
+    # Write to a temp file in the same directory and swap it in atomically,
+    # so a crash never leaves a half-written TOOLS.md behind.
+    mode = output_path.stat().st_mode & 0o777 if output_path.exists() else 0o644
+    tmp = tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", buffering=1 << 20, dir=output_path.parent,
+        prefix=".TOOLS.", suffix=".md.tmp", delete=False,
+    )
+    try:
+        with tmp:
+            tmp.write(buf.getvalue())
+        os.chmod(tmp.name, mode)  # NamedTemporaryFile creates files as 0600
+        os.replace(tmp.name, output_path)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
     print(f"Generated {output_path} with {total_tools} tools across {len(domain_tools)} domains.")
 
 
 def main() -> None:
-    asyncio.run(async_main())
+    # uvloop is optional: it trims event-loop overhead when installed, and
+    # the stdlib loop is used everywhere else (including Windows).
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(async_main())
+    else:
+        uvloop.run(async_main())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,65 @@
+"""Shared thread pool for independent calls into the Resolve scripting bridge.
+
+Used by both the tool and resource packages, so one setting controls every
+concurrent call into Resolve.  Calls run serially by default, since the
+scripting bridge is not documented as thread-safe.  Set
+``DAVINCI_RESOLVE_MCP_LOOKUP_WORKERS`` to a number above 1 to let
+concurrent_map() overlap independent per-item calls, such as the GetName()
+calls of a track scan, on that many threads.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Sequence, TypeVar
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+# Threads for concurrent_map(), e.g. the GetName() calls of a scan (0 or 1 = serial)
+_LOOKUP_WORKERS_ENV = "DAVINCI_RESOLVE_MCP_LOOKUP_WORKERS"
+
+
+def _lookup_workers() -> int:
+    """Return the scan worker count from ``$DAVINCI_RESOLVE_MCP_LOOKUP_WORKERS``.
+
+    Unset means 1 (serial).  A non-integer value is logged and also treated
+    as 1, so a typo can't stop the server from starting.
+    """
+    raw = os.environ.get(_LOOKUP_WORKERS_ENV, "").strip()
+    if not raw:
+        return 1
+    try:
+        return max(int(raw), 0)
+    except ValueError:
+        logger.warning(
+            "%s must be an integer, got %r; making calls one at a time.",
+            _LOOKUP_WORKERS_ENV,
+            raw,
+        )
+        return 1
+
+
+# Shared pool for concurrent_map(); threads are only spawned on first use.
+_LOOKUP_WORKERS = _lookup_workers()
+_lookup_executor = (
+    ThreadPoolExecutor(max_workers=_LOOKUP_WORKERS, thread_name_prefix="resolve-lookup")
+    if _LOOKUP_WORKERS > 1
+    else None
+)
+
+
+def concurrent_map(fn: Callable[[Any], T], args: Sequence[Any]) -> list[T]:
+    """Return ``[fn(arg) for arg in args]``, overlapping the calls on the lookup pool.
+
+    For independent per-item Resolve calls: each is a round trip, so running
+    them together costs roughly the slowest one.  Results keep the order of
+    *args*, and the first exception raised by any call propagates.  Runs
+    serially when ``$DAVINCI_RESOLVE_MCP_LOOKUP_WORKERS`` is 0 or 1.
+    """
+    if _lookup_executor is not None and len(args) > 1:
+        return list(_lookup_executor.map(fn, args))
+    return [fn(arg) for arg in args]
@@ -1,141 +1,172 @@
-"""Enums and constants for the DaVinci Resolve Scripting API."""
+"""String constants for the DaVinci Resolve Scripting API.
 
-from enum import Enum
+Each group of values is a plain namespace class of ``Final`` strings (so
+``ResolvePage.EDIT`` is just ``"edit"``) plus a module-level frozenset of
+its values for validation.  These strings go straight into the Resolve
+API, so there is no enum machinery in between.
+"""
 
+import sys
+from typing import Final
 
-class ResolvePage(str, Enum):
+
+def _values(namespace: type) -> frozenset[str]:
+    """Collect the public string constants of a namespace class.
+
+    Values are interned: identifier-like literals already are, but ones
+    with spaces ("Color Dodge", "HDR10 Profile A") are not, and interning
+    lets equal interned strings compare by identity.
+    """
+    return frozenset(
+        sys.intern(value) for name, value in vars(namespace).items()
+        if not name.startswith("_") and isinstance(value, str)
+    )
+
+
+class ResolvePage:
     """Pages (workspaces) available in DaVinci Resolve."""
 
-    MEDIA = "media"
-    CUT = "cut"
-    EDIT = "edit"
-    FUSION = "fusion"
-    COLOR = "color"
-    FAIRLIGHT = "fairlight"
-    DELIVER = "deliver"
+    MEDIA: Final = "media"
+    CUT: Final = "cut"
+    EDIT: Final = "edit"
+    FUSION: Final = "fusion"
+    COLOR: Final = "color"
+    FAIRLIGHT: Final = "fairlight"
+    DELIVER: Final = "deliver"
 
 
-class TrackType(str, Enum):
+class TrackType:
     """Track types in a Resolve timeline."""
 
-    VIDEO = "video"
-    AUDIO = "audio"
-    SUBTITLE = "subtitle"
+    VIDEO: Final = "video"
+    AUDIO: Final = "audio"
+    SUBTITLE: Final = "subtitle"
 
 
-class CompositeMode(str, Enum):
+class CompositeMode:
     """Composite (blend) modes for timeline items."""
 
-    NORMAL = "Normal"
-    ADD = "Add"
-    SUBTRACT = "Subtract"
-    DIFFERENCE = "Difference"
-    MULTIPLY = "Multiply"
-    SCREEN = "Screen"
-    OVERLAY = "Overlay"
-    HARDLIGHT = "Hardlight"
-    SOFTLIGHT = "Softlight"
-    DARKEN = "Darken"
-    LIGHTEN = "Lighten"
-    COLOR_DODGE = "Color Dodge"
-    COLOR_BURN = "Color Burn"
-    LINEAR_DODGE = "Linear Dodge"
-    LINEAR_BURN = "Linear Burn"
-    LINEAR_LIGHT = "Linear Light"
-    VIVID_LIGHT = "Vivid Light"
-    PIN_LIGHT = "Pin Light"
-    HARD_MIX = "Hard Mix"
-    EXCLUSION = "Exclusion"
-    HUE = "Hue"
-    SATURATION = "Saturation"
-    COLOR = "Color"
-    LUMINOSITY = "Luminosity"
-
-
-class ClipColor(str, Enum):
+    NORMAL: Final = "Normal"
+    ADD: Final = "Add"
+    SUBTRACT: Final = "Subtract"
+    DIFFERENCE: Final = "Difference"
+    MULTIPLY: Final = "Multiply"
+    SCREEN: Final = "Screen"
+    OVERLAY: Final = "Overlay"
+    HARDLIGHT: Final = "Hardlight"
+    SOFTLIGHT: Final = "Softlight"
+    DARKEN: Final = "Darken"
+    LIGHTEN: Final = "Lighten"
+    COLOR_DODGE: Final = "Color Dodge"
+    COLOR_BURN: Final = "Color Burn"
+    LINEAR_DODGE: Final = "Linear Dodge"
+    LINEAR_BURN: Final = "Linear Burn"
+    LINEAR_LIGHT: Final = "Linear Light"
+    VIVID_LIGHT: Final = "Vivid Light"
+    PIN_LIGHT: Final = "Pin Light"
+    HARD_MIX: Final = "Hard Mix"
+    EXCLUSION: Final = "Exclusion"
+    HUE: Final = "Hue"
+    SATURATION: Final = "Saturation"
+    COLOR: Final = "Color"
+    LUMINOSITY: Final = "Luminosity"
+
+
+class ClipColor:
     """Clip label colors available in DaVinci Resolve."""
 
-    ORANGE = "Orange"
-    APRICOT = "Apricot"
-    YELLOW = "Yellow"
-    LIME = "Lime"
-    OLIVE = "Olive"
-    GREEN = "Green"
-    TEAL = "Teal"
-    NAVY = "Navy"
-    BLUE = "Blue"
-    PURPLE = "Purple"
-    VIOLET = "Violet"
-    PINK = "Pink"
-    TAN = "Tan"
-    BEIGE = "Beige"
-    BROWN = "Brown"
-    CHOCOLATE = "Chocolate"
-
-
-class MarkerColor(str, Enum):
+    ORANGE: Final = "Orange"
+    APRICOT: Final = "Apricot"
+    YELLOW: Final = "Yellow"
+    LIME: Final = "Lime"
+    OLIVE: Final = "Olive"
+    GREEN: Final = "Green"
+    TEAL: Final = "Teal"
+    NAVY: Final = "Navy"
+    BLUE: Final = "Blue"
+    PURPLE: Final = "Purple"
+    VIOLET: Final = "Violet"
+    PINK: Final = "Pink"
+    TAN: Final = "Tan"
+    BEIGE: Final = "Beige"
+    BROWN: Final = "Brown"
+    CHOCOLATE: Final = "Chocolate"
+
+
+class MarkerColor:
     """Marker colors available in DaVinci Resolve."""
 
-    BLUE = "Blue"
-    CYAN = "Cyan"
-    GREEN = "Green"
-    YELLOW = "Yellow"
-    RED = "Red"
-    PINK = "Pink"
-    PURPLE = "Purple"
-    FUCHSIA = "Fuchsia"
-    ROSE = "Rose"
-    LAVENDER = "Lavender"
-    SKY = "Sky"
-    MINT = "Mint"
-    LEMON = "Lemon"
-    SAND = "Sand"
-    COCOA = "Cocoa"
-    CREAM = "Cream"
-
-
-class FlagColor(str, Enum):
+    BLUE: Final = "Blue"
+    CYAN: Final = "Cyan"
+    GREEN: Final = "Green"
+    YELLOW: Final = "Yellow"
+    RED: Final = "Red"
+    PINK: Final = "Pink"
+    PURPLE: Final = "Purple"
+    FUCHSIA: Final = "Fuchsia"
+    ROSE: Final = "Rose"
+    LAVENDER: Final = "Lavender"
+    SKY: Final = "Sky"
+    MINT: Final = "Mint"
+    LEMON: Final = "Lemon"
+    SAND: Final = "Sand"
+    COCOA: Final = "Cocoa"
+    CREAM: Final = "Cream"
+
+
+class FlagColor:
     """Flag colors for clips and timeline items."""
 
-    BLUE = "Blue"
-    CYAN = "Cyan"
-    GREEN = "Green"
-    YELLOW = "Yellow"
-    RED = "Red"
-    PINK = "Pink"
-    PURPLE = "Purple"
-    FUCHSIA = "Fuchsia"
-    ROSE = "Rose"
-    LAVENDER = "Lavender"
-    SKY = "Sky"
-    MINT = "Mint"
-    LEMON = "Lemon"
-    SAND = "Sand"
-    COCOA = "Cocoa"
-    CREAM = "Cream"
-
-
-class ExportType(str, Enum):
+    BLUE: Final = "Blue"
+    CYAN: Final = "Cyan"
+    GREEN: Final = "Green"
+    YELLOW: Final = "Yellow"
+    RED: Final = "Red"
+    PINK: Final = "Pink"
+    PURPLE: Final = "Purple"
+    FUCHSIA: Final = "Fuchsia"
+    ROSE: Final = "Rose"
+    LAVENDER: Final = "Lavender"
+    SKY: Final = "Sky"
+    MINT: Final = "Mint"
+    LEMON: Final = "Lemon"
+    SAND: Final = "Sand"
+    COCOA: Final = "Cocoa"
+    CREAM: Final = "Cream"
+
+
+class ExportType:
     """Export format types for timelines."""
 
-    AAF = "AAF"
-    DRT = "DRT"
-    EDL = "EDL"
-    FCPXML = "FCPXML"
-    HDR10_PROFILE_A = "HDR10 Profile A"
-    HDR10_PROFILE_B = "HDR10 Profile B"
-    OTIO = "OTIO"
-    TEXT_CSV = "Text CSV"
-    TEXT_TAB = "Text Tab"
+    AAF: Final = "AAF"
+    DRT: Final = "DRT"
+    EDL: Final = "EDL"
+    FCPXML: Final = "FCPXML"
+    HDR10_PROFILE_A: Final = "HDR10 Profile A"
+    HDR10_PROFILE_B: Final = "HDR10 Profile B"
+    OTIO: Final = "OTIO"
+    TEXT_CSV: Final = "Text CSV"
+    TEXT_TAB: Final = "Text Tab"
 
 
-class TimelineExportSubtype(str, Enum):
+class TimelineExportSubtype:
     """Sub-types for certain export formats."""
 
-    NONE = ""
-    SMPTE = "SMPTE"
-    AVID = "Avid"
-    CMX_3600 = "CMX 3600"
+    NONE: Final = ""
+    SMPTE: Final = "SMPTE"
+    AVID: Final = "Avid"
+    CMX_3600: Final = "CMX 3600"
+
+
+# Valid values per namespace, for O(1) validation
+RESOLVE_PAGES: frozenset[str] = _values(ResolvePage)
+TRACK_TYPES: frozenset[str] = _values(TrackType)
+COMPOSITE_MODES: frozenset[str] = _values(CompositeMode)
+CLIP_COLORS: frozenset[str] = _values(ClipColor)
+MARKER_COLORS: frozenset[str] = _values(MarkerColor)
+FLAG_COLORS: frozenset[str] = _values(FlagColor)
+EXPORT_TYPES: frozenset[str] = _values(ExportType)
+TIMELINE_EXPORT_SUBTYPES: frozenset[str] = _values(TimelineExportSubtype)
 
 
 # Commonly used Resolve project settings keys
@@ -228,3 +259,7 @@ PROJECT_SETTINGS = [
     "videoPlayoutLUT",
     "videoPlayoutLUTIndex",
 ]
+
+# Hashed view of PROJECT_SETTINGS for O(1) membership checks; the list above
+# keeps the documented order for iteration.
+PROJECT_SETTINGS_SET: frozenset[str] = frozenset(PROJECT_SETTINGS)
@@ -3,21 +3,33 @@
 Only models that are actively used by tool modules live here.
 """
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class CDLValues(BaseModel):
     """ASC-CDL color correction values (used by color.py tools)."""
 
-    slope: list[float] = Field(default=[1.0, 1.0, 1.0], description="RGB slope")
-    offset: list[float] = Field(default=[0.0, 0.0, 0.0], description="RGB offset")
-    power: list[float] = Field(default=[1.0, 1.0, 1.0], description="RGB power")
+    # Validated once and only read afterwards; unknown fields are a caller bug.
+    # Only color_set_cdl builds one, so the core schema is built on first use
+    # rather than at import.
+    model_config = ConfigDict(frozen=True, extra="forbid", defer_build=True)
+
+    # Fixed-arity tuples: Pydantic enforces exactly three channels, and the
+    # immutable defaults need no per-instance copy.
+    slope: tuple[float, float, float] = Field(default=(1.0, 1.0, 1.0), description="RGB slope")
+    offset: tuple[float, float, float] = Field(default=(0.0, 0.0, 0.0), description="RGB offset")
+    power: tuple[float, float, float] = Field(default=(1.0, 1.0, 1.0), description="RGB power")
     saturation: float = Field(default=1.0, ge=0.0, description="Saturation multiplier")
 
-    @field_validator("slope", "offset", "power")
-    @classmethod
-    def must_be_rgb_triple(cls, v: list[float]) -> list[float]:
-        """Ensure each RGB channel list contains exactly 3 elements."""
-        if len(v) != 3:
-            raise ValueError(f"Expected exactly 3 RGB values, got {len(v)}")
-        return v
+    def to_resolve_dict(self) -> dict:
+        """Return the values in the shape ``TimelineItem.SetCDL()`` expects.
+
+        Resolve takes title-case keys and list channels, not this model's
+        field names and tuples.
+        """
+        return {
+            "Slope": list(self.slope),
+            "Offset": list(self.offset),
+            "Power": list(self.power),
+            "Saturation": self.saturation,
+        }
@@ -2,7 +2,12 @@
 
 Platform auto-detection adds the correct scripting modules path before importing
 the Resolve scripting library.  A health-check runs periodically to detect stale
-references and reconnect automatically.
+references and reconnect automatically.  Handles derived from the root object
+(project manager, current project, media pool, current timeline) are cached
+for the same window and dropped whenever the health check runs, the
+connection is re-established, or a tool switches the current project or
+timeline.  Media storage does not depend on the project and is kept until
+the next reconnect.
 """
 
 from __future__ import annotations
@@ -13,39 +18,67 @@ import platform
 import sys
 import threading
 import time
+from functools import lru_cache
 from types import ModuleType
-from typing import Any
+from typing import Any, Callable
 
 from .exceptions import ResolveNotRunning
 
 # How many seconds to cache a successful health check before re-checking
 _HEALTH_CHECK_TTL = 5.0
 
+# What a stale bridge reference raises when Resolve has quit or restarted:
+# AttributeError once the remote object is gone, RuntimeError/OSError when
+# the IPC channel itself is broken.  Anything else is a real bug and must
+# propagate instead of triggering a silent reconnect.
+_STALE_HANDLE_ERRORS: tuple[type[BaseException], ...] = (
+    AttributeError,
+    RuntimeError,
+    OSError,
+)
+
+
+_MACOS_MODULES_PATH = (
+    "/Library/Application Support/Blackmagic Design/"
+    "DaVinci Resolve/Developer/Scripting/Modules/"
+)
+_LINUX_MODULES_PATH = "/opt/resolve/Developer/Scripting/Modules/"
+
+
+def _windows_modules_path() -> str:
+    """Windows path, built from %PROGRAMDATA% at call time."""
+    return os.path.join(
+        os.environ.get("PROGRAMDATA", r"C:\ProgramData"),
+        "Blackmagic Design",
+        "DaVinci Resolve",
+        "Support",
+        "Developer",
+        "Scripting",
+        "Modules",
+    )
+
+
+# platform.system() -> path builder; anything unlisted is treated as Linux
+_MODULES_PATH_BY_OS: dict[str, Callable[[], str]] = {
+    "Darwin": lambda: _MACOS_MODULES_PATH,
+    "Windows": _windows_modules_path,
+}
+
 
 def _get_modules_path() -> str:
     """Return the platform-specific path to Resolve's scripting modules."""
-    system = platform.system()
-    if system == "Darwin":
-        return (
-            "/Library/Application Support/Blackmagic Design/"
-            "DaVinci Resolve/Developer/Scripting/Modules/"
-        )
-    elif system == "Windows":
-        return os.path.join(
-            os.environ.get("PROGRAMDATA", r"C:\ProgramData"),
-            "Blackmagic Design",
-            "DaVinci Resolve",
-            "Support",
-            "Developer",
-            "Scripting",
-            "Modules",
-        )
-    else:  # Linux
-        return "/opt/resolve/Developer/Scripting/Modules/"
+    builder = _MODULES_PATH_BY_OS.get(platform.system())
+    return builder() if builder is not None else _LINUX_MODULES_PATH
 
 
+@lru_cache(maxsize=1)
 def _load_resolve_script() -> ModuleType:
-    """Import DaVinciResolveScript from the platform-specific path."""
+    """Import DaVinciResolveScript from the platform-specific path.
+
+    The result is cached for the life of the process, so reconnects after a
+    stale reference skip the path and environment setup.  A failed import
+    raises and is not cached, so a later call can still succeed.
+    """
     modules_path = _get_modules_path()
 
     # Ensure the path is on sys.path so `import DaVinciResolveScript` works
@@ -91,10 +124,20 @@ class ResolveAPI:
         self._resolve: Any = None
         self._script_module: ModuleType | None = None
         self._last_health_check: float = 0.0
-        # Protects _resolve and _last_health_check from concurrent access.
-        # Uses RLock so callers that hold the lock can safely re-enter
-        # (e.g. a property that calls _ensure_connected).
-        self._conn_lock = threading.RLock()
+        # Derived handles (project manager, project, media pool, timeline)
+        # cached until the next health check, reconnect, or
+        # invalidate_handles().
+        self._handles: dict[str, Any] = {}
+        # MediaStorage is a per-application singleton in Resolve, so it is
+        # kept for the life of the connection and only dropped on reconnect.
+        self._media_storage: Any = None
+        # Bumped on every clear so a fetch that raced an invalidation is
+        # not stored back into the fresh cache.
+        self._handles_generation: int = 0
+        # Protects _resolve, _last_health_check and the handle cache.  A plain
+        # Lock: it is never re-entered, and handle fetches (which may read
+        # other properties) run with it released.
+        self._conn_lock = threading.Lock()
 
     # ------------------------------------------------------------------
     # Singleton access (thread-safe)
@@ -139,24 +182,67 @@ class ResolveAPI:
         ``_resolve`` / ``_last_health_check``.
         """
         with self._conn_lock:
-            now = time.monotonic()
-
-            if self._resolve is not None:
-                # If last check was recent enough, skip the IPC round-trip
-                if (now - self._last_health_check) < _HEALTH_CHECK_TTL:
-                    return self._resolve
-                try:
-                    # Quick health check — cheapest API call
-                    self._resolve.GetVersion()
-                    self._last_health_check = now
-                    return self._resolve
-                except (AttributeError, RuntimeError, OSError):
-                    # Stale reference — reconnect
-                    self._resolve = None
-
-            self._resolve = self._connect()
-            self._last_health_check = time.monotonic()
-            return self._resolve
+            return self._ensure_connected_locked()
+
+    def _ensure_connected_locked(self) -> Any:
+        """Body of :meth:`_ensure_connected`; the caller holds ``_conn_lock``."""
+        now = time.monotonic()
+
+        if self._resolve is not None:
+            # If last check was recent enough, skip the IPC round-trip
+            if (now - self._last_health_check) < _HEALTH_CHECK_TTL:
+                return self._resolve
+            # Re-fetch derived handles after every real health check so
+            # changes made in the Resolve UI are picked up within the TTL
+            self._clear_handles()
+            try:
+                # Quick health check — cheapest API call
+                self._resolve.GetVersion()
+                self._last_health_check = now
+                return self._resolve
+            except _STALE_HANDLE_ERRORS:
+                # Stale reference — reconnect
+                self._resolve = None
+
+        self._clear_handles()
+        self._media_storage = None
+        self._resolve = self._connect()
+        self._last_health_check = time.monotonic()
+        return self._resolve
+
+    def _clear_handles(self) -> None:
+        """Empty the handle cache; the caller holds ``_conn_lock``."""
+        self._handles.clear()
+        self._handles_generation += 1
+
+    def invalidate_handles(self) -> None:
+        """Drop cached derived handles so the next access re-fetches them.
+
+        Tools that change the current project or timeline call this right
+        after the switching API call.
+        """
+        with self._conn_lock:
+            self._clear_handles()
+
+    def _cached_handle(self, key: str, fetch: Callable[[Any], Any]) -> Any:
+        """Return the cached handle *key*, calling ``fetch(resolve)`` on a miss.
+
+        The fetch runs with ``_conn_lock`` released, so it may read other
+        properties; its result is only stored if no clear happened meanwhile.
+        """
+        with self._conn_lock:
+            resolve = self._ensure_connected_locked()
+            try:
+                return self._handles[key]
+            except KeyError:
+                generation = self._handles_generation
+
+        value = fetch(resolve)
+
+        with self._conn_lock:
+            if self._handles_generation == generation:
+                self._handles[key] = value
+        return value
 
     # ------------------------------------------------------------------
     # Convenience properties — each call validates the connection first
@@ -169,33 +255,79 @@ class ResolveAPI:
     @property
     def project_manager(self) -> Any:
         """Resolve → GetProjectManager()."""
-        pm = self.resolve.GetProjectManager()
-        if pm is None:
-            raise ResolveNotRunning("Could not access Project Manager.")
-        return pm
+        def fetch(resolve: Any) -> Any:
+            pm = resolve.GetProjectManager()
+            if pm is None:
+                raise ResolveNotRunning("Could not access Project Manager.")
+            return pm
+        return self._cached_handle("project_manager", fetch)
 
     @property
     def project(self) -> Any:
         """Current open project (may be None if no project is open)."""
-        return self.project_manager.GetCurrentProject()
+        return self._cached_handle(
+            "project", lambda _resolve: self.project_manager.GetCurrentProject()
+        )
 
     @property
     def media_pool(self) -> Any:
         """Current project → GetMediaPool()."""
-        proj = self.project
-        if proj is None:
-            return None
-        return proj.GetMediaPool()
+        def fetch(_resolve: Any) -> Any:
+            proj = self.project
+            if proj is None:
+                return None
+            return proj.GetMediaPool()
+        return self._cached_handle("media_pool", fetch)
 
     @property
     def media_storage(self) -> Any:
-        """Resolve → GetMediaStorage()."""
-        return self.resolve.GetMediaStorage()
+        """Resolve → GetMediaStorage(), cached until the next reconnect."""
+        with self._conn_lock:
+            resolve = self._ensure_connected_locked()
+            if self._media_storage is None:
+                self._media_storage = resolve.GetMediaStorage()
+            return self._media_storage
 
     @property
     def timeline(self) -> Any:
         """Current project → GetCurrentTimeline() (may be None)."""
+        def fetch(_resolve: Any) -> Any:
+            proj = self.project
+            if proj is None:
+                return None
+            return proj.GetCurrentTimeline()
+        return self._cached_handle("timeline", fetch)
+
+    # ------------------------------------------------------------------
+    # Batched reads
+    # ------------------------------------------------------------------
+    def get_project_settings(self, keys: tuple[str, ...]) -> dict[str, Any]:
+        """Read several settings of the current project in one round-trip.
+
+        ``GetSetting()`` with no argument returns every project setting as a
+        dict; that dict is cached with the other handles, so repeated reads
+        inside the health-check window cost no IPC at all.  Bridges that do
+        not support the no-arg form fall back to one call per key.
+
+        Returns:
+            A dict mapping each key to its value (None for unknown keys),
+            or an empty dict if no project is open.
+        """
+        def fetch(_resolve: Any) -> Any:
+            proj = self.project
+            if proj is None:
+                return None
+            try:
+                settings = proj.GetSetting()
+            except TypeError:
+                return None
+            return settings if isinstance(settings, dict) else None
+
+        settings = self._cached_handle("project_settings", fetch)
+        if settings is not None:
+            return {key: settings.get(key) for key in keys}
+
         proj = self.project
         if proj is None:
-            return None
-        return proj.GetCurrentTimeline()
+            return {}
+        return {key: proj.GetSetting(key) for key in keys}
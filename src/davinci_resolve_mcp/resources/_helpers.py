@@ -0,0 +1,70 @@
+"""Shared helpers used by the resource modules.
+
+Resources are read often (clients poll them for context), so their JSON
+encoding goes through one fast path here instead of each module calling
+``json.dumps`` directly.  Fixed-shape payloads can use a serializer from
+:func:`compile_object`, and independent Resolve getters can be issued
+together with :func:`batch_calls`.
+"""
+
+from __future__ import annotations
+
+import json
+from json.encoder import encode_basestring
+from typing import Any, Callable, Sequence
+
+from ..concurrency import concurrent_map
+
+try:
+    import orjson
+except ImportError:  # optional dependency: pip install davinci-resolve-mcp[fast]
+    orjson = None
+
+
+def dumps(obj: Any) -> str:
+    """Serialise *obj* to a compact JSON string.
+
+    Uses orjson when it is installed and falls back to the stdlib otherwise.
+    Both paths emit the same compact separators, so the output does not
+    depend on which encoder is available.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def _encode_value(value: Any) -> str:
+    """Encode one JSON value, fast-pathing the str and int fields resources use."""
+    kind = type(value)
+    if kind is str:
+        return encode_basestring(value)
+    if kind is int:
+        return int.__repr__(value)
+    return dumps(value)
+
+
+def compile_object(*keys: str) -> Callable[..., str]:
+    """Build a serializer for a JSON object with a fixed key order.
+
+    The key names and punctuation are encoded once into a ``%``-template, so
+    each call only encodes the values, passed positionally in *keys* order.
+    Output matches :func:`dumps` on the equivalent dict, without building it.
+    """
+    template = "{" + ",".join(f"{dumps(key)}:%s" for key in keys) + "}"
+
+    def encode(*values: Any) -> str:
+        return template % tuple(map(_encode_value, values))
+
+    return encode
+
+
+def batch_calls(calls: Sequence[Callable[[], Any]]) -> list[Any]:
+    """Run independent zero-argument Resolve getters concurrently.
+
+    Each scripting call is a round trip to the Resolve process, so issuing
+    them together costs roughly the slowest call instead of the sum.
+    Results come back in the order of *calls*; the first exception raised
+    by any call propagates to the caller.  Runs on the shared lookup pool,
+    so ``$DAVINCI_RESOLVE_MCP_LOOKUP_WORKERS`` limits these calls too.
+    """
+    return concurrent_map(lambda call: call(), calls)
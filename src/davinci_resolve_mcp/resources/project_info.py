@@ -2,12 +2,31 @@
 
 from __future__ import annotations
 
-import json
-
 from fastmcp import FastMCP
 
 from ..resolve_api import ResolveAPI
 from ..exceptions import ResolveNotRunning
+from ._helpers import dumps
+
+_SETTING_KEYS = (
+    "timelineResolutionWidth",
+    "timelineResolutionHeight",
+    "timelineFrameRate",
+)
+
+# Static error payloads, encoded once at import time
+_ERR_NO_PROJECT = dumps({
+    "error": "No project is currently open.",
+    "name": None,
+})
+_ERR_NOT_RUNNING = dumps({
+    "error": "DaVinci Resolve is not running.",
+    "name": None,
+})
+_ERR_STALE = dumps({
+    "error": "Lost connection to Resolve (stale reference). Please retry.",
+    "name": None,
+})
 
 
 def register(mcp: FastMCP) -> None:
@@ -28,26 +47,24 @@ def register(mcp: FastMCP) -> None:
             project = api.project
 
             if project is None:
-                return json.dumps({
-                    "error": "No project is currently open.",
-                    "name": None,
-                })
+                return _ERR_NO_PROJECT
 
-            # Read a few key settings for context
-            width = project.GetSetting("timelineResolutionWidth") or "unknown"
-            height = project.GetSetting("timelineResolutionHeight") or "unknown"
-            fps = project.GetSetting("timelineFrameRate") or "unknown"
+            # Read a few key settings for context in one batched call
+            settings = api.get_project_settings(_SETTING_KEYS)
+            width = settings.get("timelineResolutionWidth") or "unknown"
+            height = settings.get("timelineResolutionHeight") or "unknown"
+            fps = settings.get("timelineFrameRate") or "unknown"
 
-            return json.dumps({
+            return dumps({
                 "name": project.GetName(),
                 "timeline_count": project.GetTimelineCount() or 0,
                 "resolution": f"{width}x{height}",
                 "frame_rate": fps,
             })
         except ResolveNotRunning:
-            return json.dumps({
-                "error": "DaVinci Resolve is not running.",
-                "name": None,
-            })
+            return _ERR_NOT_RUNNING
+        except AttributeError:
+            # Stale bridge reference, same as the tools' AttributeError branch
+            return _ERR_STALE
         except Exception as exc:
-            return json.dumps({"error": str(exc)})
+            return dumps({"error": str(exc)})
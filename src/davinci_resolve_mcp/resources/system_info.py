@@ -2,12 +2,34 @@
 
 from __future__ import annotations
 
-import json
+from typing import Any
 
 from fastmcp import FastMCP
 
 from ..resolve_api import ResolveAPI
 from ..exceptions import ResolveNotRunning
+from ._helpers import compile_object, dumps
+
+# Static error payloads, encoded once at import time
+_ERR_NOT_RUNNING = dumps({
+    "error": "DaVinci Resolve is not running.",
+    "version": None,
+    "product": None,
+    "current_page": None,
+})
+_ERR_STALE = dumps({
+    "error": "Lost connection to Resolve (stale reference). Please retry.",
+    "version": None,
+    "product": None,
+    "current_page": None,
+})
+
+_encode_system = compile_object("version", "product", "current_page")
+
+# (resolve handle, version, product) from the last read.  Version and product
+# cannot change while a connection is alive, so only a new handle (i.e. a
+# reconnect) triggers a re-fetch.
+_identity_cache: tuple[Any, str, str] | None = None
 
 
 def register(mcp: FastMCP) -> None:
@@ -22,28 +44,33 @@ def register(mcp: FastMCP) -> None:
         - product: "DaVinci Resolve" or "DaVinci Resolve Studio"
         - current_page: Active workspace page name
         """
+        global _identity_cache
         try:
             api = ResolveAPI.get_instance()
             resolve = api.resolve
 
-            # Version may come back as a list of ints or a string
-            raw_version = resolve.GetVersion()
-            if isinstance(raw_version, (list, tuple)):
-                version = ".".join(str(v) for v in raw_version)
+            cached = _identity_cache
+            if cached is not None and cached[0] is resolve:
+                _, version, product = cached
             else:
-                version = str(raw_version)
+                # Version may come back as a list of ints or a string
+                raw_version = resolve.GetVersion()
+                if isinstance(raw_version, (list, tuple)):
+                    version = ".".join(str(v) for v in raw_version)
+                else:
+                    version = str(raw_version)
+                product = resolve.GetProductName() or "DaVinci Resolve"
+                _identity_cache = (resolve, version, product)
 
-            return json.dumps({
-                "version": version,
-                "product": resolve.GetProductName() or "DaVinci Resolve",
-                "current_page": resolve.GetCurrentPage() or "unknown",
-            })
+            return _encode_system(
+                version,
+                product,
+                resolve.GetCurrentPage() or "unknown",
+            )
         except ResolveNotRunning:
-            return json.dumps({
-                "error": "DaVinci Resolve is not running.",
-                "version": None,
-                "product": None,
-                "current_page": None,
-            })
+            return _ERR_NOT_RUNNING
+        except AttributeError:
+            # Stale bridge reference, same as the tools' AttributeError branch
+            return _ERR_STALE
         except Exception as exc:
-            return json.dumps({"error": str(exc)})
+            return dumps({"error": str(exc)})
@@ -2,12 +2,35 @@
 
 from __future__ import annotations
 
-import json
-
 from fastmcp import FastMCP
 
 from ..resolve_api import ResolveAPI
 from ..exceptions import ResolveNotRunning
+from ._helpers import batch_calls, compile_object, dumps
+
+# Static error payloads, encoded once at import time
+_ERR_NO_TIMELINE = dumps({
+    "error": "No timeline is currently open.",
+    "name": None,
+})
+_ERR_NOT_RUNNING = dumps({
+    "error": "DaVinci Resolve is not running.",
+    "name": None,
+})
+_ERR_STALE = dumps({
+    "error": "Lost connection to Resolve (stale reference). Please retry.",
+    "name": None,
+})
+
+_encode_timeline = compile_object(
+    "name",
+    "start_frame",
+    "end_frame",
+    "video_tracks",
+    "audio_tracks",
+    "start_timecode",
+    "current_timecode",
+)
 
 
 def register(mcp: FastMCP) -> None:
@@ -29,24 +52,35 @@ def register(mcp: FastMCP) -> None:
             tl = api.timeline
 
             if tl is None:
-                return json.dumps({
-                    "error": "No timeline is currently open.",
-                    "name": None,
-                })
-
-            return json.dumps({
-                "name": tl.GetName(),
-                "start_frame": tl.GetStartFrame(),
-                "end_frame": tl.GetEndFrame(),
-                "video_tracks": tl.GetTrackCount("video") or 0,
-                "audio_tracks": tl.GetTrackCount("audio") or 0,
-                "start_timecode": tl.GetStartTimecode() or "",
-                "current_timecode": tl.GetCurrentTimecode() or "",
-            })
+                return _ERR_NO_TIMELINE
+
+            # The getters are independent, so issue them together
+            (
+                name, start_frame, end_frame, video_tracks, audio_tracks,
+                start_timecode, current_timecode,
+            ) = batch_calls((
+                tl.GetName,
+                tl.GetStartFrame,
+                tl.GetEndFrame,
+                lambda: tl.GetTrackCount("video"),
+                lambda: tl.GetTrackCount("audio"),
+                tl.GetStartTimecode,
+                tl.GetCurrentTimecode,
+            ))
+
+            return _encode_timeline(
+                name,
+                start_frame,
+                end_frame,
+                video_tracks or 0,
+                audio_tracks or 0,
+                start_timecode or "",
+                current_timecode or "",
+            )
         except ResolveNotRunning:
-            return json.dumps({
-                "error": "DaVinci Resolve is not running.",
-                "name": None,
-            })
+            return _ERR_NOT_RUNNING
+        except AttributeError:
+            # Stale bridge reference, same as the tools' AttributeError branch
+            return _ERR_STALE
         except Exception as exc:
-            return json.dumps({"error": str(exc)})
+            return dumps({"error": str(exc)})
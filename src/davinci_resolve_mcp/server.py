@@ -3,51 +3,67 @@
 Entry point: `davinci-resolve-mcp` (see pyproject.toml [project.scripts]).
 """
 
+from __future__ import annotations
+
+import os
+from importlib import import_module
+
 from fastmcp import FastMCP
 
-# Import registration functions from each domain module
-from .tools import (
-    playback,
-    project,
-    media_storage,
-    media_pool,
-    media_pool_item,
-    timeline,
-    timeline_item,
-    render,
-    color,
-    fusion,
-    gallery,
-    fairlight,
-)
 from .resources import system_info, project_info, timeline_info
 
 # Create the MCP server instance — FastMCP v2 only takes the name positional arg
 mcp = FastMCP("DaVinci Resolve")
 
 # ---------------------------------------------------------------------------
-# Register every tool module — each adds its @mcp.tool() functions
+# Register tool modules — each adds its @mcp.tool() functions
 # ---------------------------------------------------------------------------
-_TOOL_MODULES = [
+# Listed by name so a module is only imported when it is actually registered.
+_TOOL_MODULES = (
     # Phase 1: Core
-    playback,
-    project,
-    media_storage,
-    media_pool,
-    media_pool_item,
-    timeline,
-    timeline_item,
-    render,
+    "playback",
+    "project",
+    "media_storage",
+    "media_pool",
+    "media_pool_item",
+    "timeline",
+    "timeline_item",
+    "render",
     # Phase 2: Color + Fusion
-    color,
-    fusion,
+    "color",
+    "fusion",
     # Phase 3: Gallery + Fairlight
-    gallery,
-    fairlight,
-]
+    "gallery",
+    "fairlight",
+)
 
-for mod in _TOOL_MODULES:
-    mod.register(mcp)
+# Comma-separated subset of _TOOL_MODULES to register (default: all of them)
+_TOOLS_ENV = "DAVINCI_RESOLVE_MCP_TOOLS"
+
+
+def _selected_tool_modules() -> tuple[str, ...]:
+    """Return the tool modules to register, honouring ``$DAVINCI_RESOLVE_MCP_TOOLS``.
+
+    Unknown names raise ``ValueError`` so a typo fails at startup instead of
+    silently dropping a whole domain.
+    """
+    raw = os.environ.get(_TOOLS_ENV, "")
+    wanted = {name.strip() for name in raw.split(",") if name.strip()}
+    if not wanted:
+        return _TOOL_MODULES
+
+    unknown = wanted.difference(_TOOL_MODULES)
+    if unknown:
+        raise ValueError(
+            f"Unknown tool module(s) in {_TOOLS_ENV}: {', '.join(sorted(unknown))}. "
+            f"Valid modules: {', '.join(_TOOL_MODULES)}."
+        )
+    # Keep the canonical registration order regardless of how they were listed
+    return tuple(name for name in _TOOL_MODULES if name in wanted)
+
+
+for name in _selected_tool_modules():
+    import_module(f".tools.{name}", __package__).register(mcp)
 
 # ---------------------------------------------------------------------------
 # Register resources
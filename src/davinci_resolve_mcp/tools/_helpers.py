@@ -1,20 +1,112 @@
 """Shared helpers used by multiple tool modules.
 
 Consolidates duplicated utility functions (require_timeline, require_media_pool,
-find_item) and the VALID_TRACK_TYPES constant that were previously copy-pasted
-across color.py, fusion.py, timeline_item.py, and timeline.py.
+find_item, paginate) and the VALID_TRACK_TYPES constant that were previously
+copy-pasted across color.py, fusion.py, media_pool.py, timeline_item.py, and
+timeline.py.  find_items() is the batch form of find_item() for tools that
+take a list of item names, TTLCache backs short-lived caches of read-only
+tool results, and is_unsupported()/mark_unsupported() remember scripting
+methods missing from the connected Resolve build.  Tools that change a
+timeline's items call invalidate_item_index() so find_item() rescans, and
+tools that change a grade call invalidate_grade_cache().
+concurrent_map() is re-exported from ..concurrency for the tool modules.
 """
 
 from __future__ import annotations
 
-from typing import Any
+import threading
+import time
+from typing import Any, Callable, Hashable, Iterable, Sequence, TypeVar
 
-from ..constants import TrackType
+from ..concurrency import concurrent_map
+from ..constants import TRACK_TYPES
 from ..exceptions import ResolveNotRunning, ResolveOperationFailed
 from ..resolve_api import ResolveAPI
 
-# Canonical set derived from the TrackType enum so it stays in sync automatically.
-VALID_TRACK_TYPES = {t.value for t in TrackType}
+# Canonical set derived from the TrackType constants so it stays in sync automatically.
+VALID_TRACK_TYPES = TRACK_TYPES
+# Sorted listing for error messages, built once instead of on every failure.
+VALID_TRACK_TYPES_STR = ", ".join(sorted(VALID_TRACK_TYPES))
+
+T = TypeVar("T")
+
+# Last ResolveAPI seen by _get_api(); re-validated against the class-level
+# singleton so ResolveAPI.reset() (and test fixtures) are honoured.
+_api_cache: ResolveAPI | None = None
+
+
+def _get_api() -> ResolveAPI:
+    """Return the ResolveAPI singleton, skipping get_instance() when cached."""
+    global _api_cache
+    api = _api_cache
+    if api is None or api is not ResolveAPI._instance:
+        api = _api_cache = ResolveAPI.get_instance()
+    return api
+
+
+# Scripting method name -> the Resolve connection it was found missing on.
+# Keyed on the connection object so a reconnect (e.g. after a Resolve
+# upgrade) probes again.
+_unsupported: dict[str, Any] = {}
+
+
+def is_unsupported(method: str) -> bool:
+    """Return True if *method* is known to be missing on this Resolve build.
+
+    Tools for version-dependent scripting calls check this first and skip
+    straight to their "unsupported" result instead of re-probing.
+    """
+    return method in _unsupported and _unsupported[method] is _get_api().resolve
+
+
+def mark_unsupported(method: str) -> None:
+    """Record that calling *method* raised AttributeError on this connection."""
+    _unsupported[method] = _get_api().resolve
+
+
+# id(project handle) -> (handle, identity key) for the handle last passed to
+# project_cache_key().  Holds at most one entry; the handle is kept so a
+# recycled id() can't match a different project.
+_project_keys: dict[int, tuple[Any, Hashable]] = {}
+
+
+def project_cache_key(project: Any) -> Hashable:
+    """Return a cache key identifying *project* across handle re-fetches.
+
+    The project's unique ID is read once per handle, so a cache hit costs no
+    scripting call; ResolveAPI re-fetches the handle at its next health
+    check, at most every 5 s.  Builds without GetUniqueId() fall back to the
+    project name.
+    """
+    entry = _project_keys.get(id(project))
+    if entry is not None and entry[0] is project:
+        return entry[1]
+    try:
+        key: Hashable = ("id", project.GetUniqueId())
+    except AttributeError:
+        key = ("name", project.GetName())
+    _project_keys.clear()
+    _project_keys[id(project)] = (project, key)
+    return key
+
+
+# (track_type, track_index) -> (timeline the map was built from, name -> item).
+# Lets repeated find_item() calls on one track skip the per-item GetName() scan.
+# Keyed on the handle, so it lasts at most until ResolveAPI re-fetches handles
+# at its next health check (5 s): an edit made in Resolve's own UI is seen by
+# the first lookup after that, and a hit costs no extra identity call.
+_track_name_index: dict[tuple[str, int], tuple[Any, dict[str, Any]]] = {}
+
+
+def invalidate_item_index() -> None:
+    """Forget the name index used by find_item() and find_items().
+
+    A cached hit is only re-checked with GetName(), which can't tell that a
+    clip was replaced by a same-named one or that a same-named clip now
+    comes earlier on the track.  Tools that add, delete or restructure
+    timeline items call this after changing the timeline.
+    """
+    _track_name_index.clear()
 
 
 def require_timeline() -> Any:
@@ -23,8 +115,7 @@ def require_timeline() -> Any:
     Centralises the repeated "get API -> get timeline -> None check"
     boilerplate so each tool doesn't have to duplicate it.
     """
-    api = ResolveAPI.get_instance()
-    timeline = api.timeline
+    timeline = _get_api().timeline
     if timeline is None:
         raise ResolveOperationFailed(
             "require_timeline",
@@ -39,8 +130,7 @@ def require_media_pool() -> Any:
     Used by tools that operate on the media pool (e.g. inserting generators
     or titles) rather than on individual timeline items.
     """
-    api = ResolveAPI.get_instance()
-    pool = api.media_pool
+    pool = _get_api().media_pool
     if pool is None:
         raise ResolveOperationFailed(
             "require_media_pool",
@@ -60,6 +150,10 @@ def find_item(
     to skip stale or invalid item references.  Validates track_type and
     track_index before calling the Resolve API.
 
+    Names are indexed per track and reused while the same timeline handle is
+    current, so batch operations on one track cost one scan instead of one
+    scan per item.  A miss or a renamed hit falls back to a fresh scan.
+
     Args:
         name:        Exact display name of the timeline item.
         track_type:  Track type -- "video", "audio", or "subtitle".
@@ -72,42 +166,224 @@ def find_item(
         ResolveOperationFailed: If the track type is invalid, the track
             is empty, or no item matches the given name.
     """
+    return _find_items("find_item", (name,), track_type, track_index)[name]
+
+
+def find_items(
+    names: Iterable[str],
+    track_type: str = "video",
+    track_index: int = 1,
+) -> dict[str, Any]:
+    """Locate several timeline items by name on one track in a single pass.
+
+    Batch counterpart of :func:`find_item` for tools that take a list of
+    names: the track is fetched and scanned at most once for all of them.
+
+    Returns:
+        A dict mapping each requested name to its TimelineItem, in the
+        order the names were given (duplicates collapse to one entry).
+
+    Raises:
+        ResolveOperationFailed: If the track type is invalid, the track
+            is empty, or any of the names has no matching item.
+    """
+    return _find_items("find_items", names, track_type, track_index)
+
+
+def _find_items(
+    op: str,
+    names: Iterable[str],
+    track_type: str,
+    track_index: int,
+) -> dict[str, Any]:
+    """Shared implementation of find_item() and find_items()."""
     # Validate track_type before hitting the API to give a clear error
     if track_type not in VALID_TRACK_TYPES:
         raise ResolveOperationFailed(
-            "find_item",
+            op,
             f"Invalid track_type '{track_type}'. "
-            f"Must be one of: {', '.join(sorted(VALID_TRACK_TYPES))}.",
+            f"Must be one of: {VALID_TRACK_TYPES_STR}.",
         )
 
     # Validate track_index is a positive integer (1-based indexing)
     if track_index < 1:
         raise ResolveOperationFailed(
-            "find_item",
+            op,
             f"track_index must be >= 1, got {track_index}.",
         )
 
+    wanted = list(dict.fromkeys(names))
     timeline = require_timeline()
+    key = (track_type, track_index)
+
+    # Fast path: reuse the name index built for this timeline, confirming each
+    # hit with a single GetName() in case the item was renamed or removed
+    cached = _track_name_index.get(key)
+    if cached is not None and cached[0] is timeline:
+        found = {}
+        for name in wanted:
+            item = cached[1].get(name)
+            if item is None:
+                break
+            try:
+                if item.GetName() != name:
+                    break
+            except AttributeError:
+                break
+            found[name] = item
+        else:
+            return found
 
     # GetItemListInTrack() returns a list of TimelineItem objects or None
     items = timeline.GetItemListInTrack(track_type, track_index)
     if not items:
+        _track_name_index.pop(key, None)
         raise ResolveOperationFailed(
-            "find_item",
+            op,
             f"Track '{track_type}' index {track_index} has no items. "
-            f"Cannot find '{name}'.",
+            f"Cannot find {_quoted(wanted)}.",
         )
 
-    # Linear scan with AttributeError guard for stale item references
-    for item in items:
-        try:
-            if item.GetName() == name:
-                return item
-        except AttributeError:
-            # Skip stale or invalid item references
-            continue
-
-    raise ResolveOperationFailed(
-        "find_item",
-        f"Item '{name}' not found on {track_type} track {track_index}.",
-    )
+    # Rebuild the index in one pass; the first item with a given name wins,
+    # matching the old linear scan.  Stale item references are skipped.
+    # The GetName() round trips are independent, so they overlap on the
+    # lookup pool; results keep track order, which keeps first-wins intact.
+    item_names = concurrent_map(_item_name, items)
+    name_map: dict[str, Any] = {}
+    for item_name, item in zip(item_names, items):
+        if item_name is not None:
+            name_map.setdefault(item_name, item)
+    _track_name_index[key] = (timeline, name_map)
+
+    missing = [name for name in wanted if name not in name_map]
+    if missing:
+        noun = "Item" if len(missing) == 1 else "Items"
+        raise ResolveOperationFailed(
+            op,
+            f"{noun} {_quoted(missing)} not found on {track_type} track {track_index}.",
+        )
+    return {name: name_map[name] for name in wanted}
+
+
+def _item_name(item: Any) -> str | None:
+    """Return ``item.GetName()``, or None for a stale item reference."""
+    try:
+        return item.GetName()
+    except AttributeError:
+        return None
+
+
+def _quoted(names: Sequence[str]) -> str:
+    """Format names for error messages: 'a', 'b'."""
+    return ", ".join(f"'{name}'" for name in names)
+
+
+def paginate(
+    all_items: Sequence[T] | None,
+    offset: int,
+    limit: int,
+    describe: Callable[[T], dict],
+) -> dict:
+    """Return one page of *all_items* in the standard pagination shape.
+
+    Only the items on the requested page are passed to *describe*, so the
+    per-item Resolve calls scale with ``limit``, not with the list length.
+
+    Returns:
+        A dict with keys: items, total, offset, limit, has_more.
+    """
+    all_items = all_items or ()
+    total = len(all_items)
+    return {
+        "items": [describe(item) for item in all_items[offset : offset + limit]],
+        "total": total,
+        "offset": offset,
+        "limit": limit,
+        "has_more": (offset + limit) < total,
+    }
+
+
+class TTLCache:
+    """Thread-safe cache of read results that expire after *ttl* seconds.
+
+    Entries are grouped (e.g. by timeline item) so a mutating tool can drop
+    everything it may have changed with a single :meth:`invalidate` call.
+    Only successful results are stored; exceptions from *fetch* propagate
+    and leave the cache untouched.  A fetch that overlaps an invalidation is
+    returned but not stored, so it can't reinstate pre-mutation state.
+    Expired entries are refetched by the caller that finds them expired;
+    nothing calls into Resolve in the background.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._groups: dict[Hashable, dict[Hashable, tuple[Any, float]]] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(self, group: Hashable, key: Hashable, fetch: Callable[[], T]) -> T:
+        """Return the cached value for (*group*, *key*), calling *fetch* on a miss."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._groups.get(group, {}).get(key)
+            generation = self._generation
+        if entry is not None and now < entry[1]:
+            return entry[0]
+
+        # Fetch outside the lock so a slow Resolve call doesn't block others
+        value = fetch()
+        self._store(group, key, value, generation, now)
+        return value
+
+    def invalidate(self, group: Hashable) -> None:
+        """Drop every cached entry in *group*."""
+        with self._lock:
+            self._groups.pop(group, None)
+            self._generation += 1
+
+    def clear(self) -> int:
+        """Drop all entries and return how many were removed."""
+        with self._lock:
+            count = sum(len(entries) for entries in self._groups.values())
+            self._groups.clear()
+            self._generation += 1
+        return count
+
+    def _store(
+        self,
+        group: Hashable,
+        key: Hashable,
+        value: Any,
+        generation: int,
+        now: float,
+    ) -> None:
+        """Store a fetched value unless an invalidation happened meanwhile."""
+        with self._lock:
+            if generation == self._generation:
+                self._prune(now)
+                self._groups.setdefault(group, {})[key] = (value, now + self.ttl)
+
+    def _prune(self, now: float) -> None:
+        """Drop expired entries so stale groups don't accumulate.  Caller holds the lock."""
+        for group in list(self._groups):
+            entries = self._groups[group]
+            for key in [k for k, (_, deadline) in entries.items() if deadline <= now]:
+                del entries[key]
+            if not entries:
+                del self._groups[group]
+
+
+# Read-only grade queries (node count, LUT, CDL, versions) made by the color
+# tools are cached briefly, grouped per timeline item so any tool module that
+# changes a grade can drop exactly what it touched without importing color.py.
+_GRADE_CACHE_TTL = 2.0
+_grade_cache = TTLCache(_GRADE_CACHE_TTL)
+
+
+def invalidate_grade_cache(
+    item_name: str,
+    track_type: str = "video",
+    track_index: int = 1,
+) -> None:
+    """Drop cached grade reads for one timeline item after it was modified."""
+    _grade_cache.invalidate((item_name, track_type, track_index))
@@ -13,14 +13,109 @@ their usage.
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Callable
 
 from fastmcp import FastMCP
 
 from ..exceptions import ResolveNotRunning, ResolveOperationFailed
 from ..models import CDLValues
 from ..resolve_api import ResolveAPI
-from ._helpers import find_item, require_timeline
+from ._helpers import (
+    TTLCache,
+    _grade_cache,
+    concurrent_map,
+    find_item,
+    find_items,
+    invalidate_grade_cache,
+    is_unsupported,
+    mark_unsupported,
+    project_cache_key,
+    require_timeline,
+)
+
+# The project's color group list changes rarely, so it is kept longer.  It is
+# keyed on project_cache_key() rather than the handle, which ResolveAPI
+# re-fetches after every health check; group create/delete invalidate it.
+_GROUP_CACHE_TTL = 30.0
+_group_cache = TTLCache(_GROUP_CACHE_TTL)
+
+# ApplyGradeFromDRX modes: 0 = No keyframes, 1 = Source, 2 = Timeline
+_VALID_GRADE_MODES = frozenset({0, 1, 2})
+
+# Neutral CDL used by color_reset_grade.  The bridge copies it into Resolve
+# and never mutates it, so one shared dict serves every call.
+_IDENTITY_CDL = {
+    "Slope": [1.0, 1.0, 1.0],
+    "Offset": [0.0, 0.0, 0.0],
+    "Power": [1.0, 1.0, 1.0],
+    "Saturation": 1.0,
+}
+
+
+def _cached_read(
+    item_name: str,
+    track_type: str,
+    track_index: int,
+    key: tuple,
+    read: Callable[[Any], Any],
+) -> Any:
+    """Return ``read(item)`` for a timeline item, served from the grade cache.
+
+    The current timeline handle is part of the key, so a timeline switch
+    never serves values read from another timeline's item of the same name.
+    """
+    timeline = require_timeline()
+    return _grade_cache.get(
+        (item_name, track_type, track_index),
+        (timeline, *key),
+        lambda: read(find_item(item_name, track_type, track_index)),
+    )
+
+
+def _not_available(op: str, method: str) -> ResolveOperationFailed:
+    """Error for a scripting method this Resolve build does not provide.
+
+    Raised instead of ResolveNotRunning when find_item() has just confirmed
+    the item is live, so the AttributeError can only mean a missing method
+    and retrying would not help.
+    """
+    return ResolveOperationFailed(
+        op, f"{method}() is not available in this Resolve version."
+    )
+
+
+def _set_group_membership(
+    op: str,
+    item_names: list[str],
+    group_id: str,
+    member: bool,
+    track_type: str,
+    track_index: int,
+) -> dict[str, bool]:
+    """Shared body of the bulk color group tools; returns name -> success."""
+
+    def apply(item: Any) -> bool:
+        try:
+            return bool(item.SetGroupMembership(group_id, member))
+        except AttributeError:
+            # SetGroupMembership() may not exist in older Resolve versions
+            mark_unsupported("SetGroupMembership")
+            return False
+
+    if is_unsupported("SetGroupMembership"):
+        return dict.fromkeys(item_names, False)
+    try:
+        # All names are resolved before any membership changes
+        items = find_items(item_names, track_type, track_index)
+        return dict(zip(items, concurrent_map(apply, list(items.values()))))
+    except (ResolveNotRunning, ResolveOperationFailed):
+        raise
+    except AttributeError as exc:
+        raise ResolveNotRunning(
+            f"Lost connection to Resolve (stale reference: {exc}). Please retry."
+        ) from exc
+    except Exception as exc:
+        raise ResolveOperationFailed(op, str(exc)) from exc
 
 
 # ---------------------------------------------------------------------------
@@ -51,9 +146,11 @@ def register(mcp: FastMCP) -> None:
             The node count as an integer.
         """
         try:
-            item = find_item(item_name, track_type, track_index)
             # GetNumNodes() returns the total number of corrector nodes
-            count: int = item.GetNumNodes()
+            count: int = _cached_read(
+                item_name, track_type, track_index, ("num_nodes",),
+                lambda item: item.GetNumNodes(),
+            )
             return count
         except (ResolveNotRunning, ResolveOperationFailed):
             raise
@@ -99,6 +196,7 @@ def register(mcp: FastMCP) -> None:
             item = find_item(item_name, track_type, track_index)
             # SetLUT(nodeIndex, lutPath) returns True on success
             result: bool = item.SetLUT(node_index, lut_path)
+            invalidate_grade_cache(item_name, track_type, track_index)
             if not result:
                 raise ResolveOperationFailed(
                     "color_set_lut",
@@ -117,6 +215,63 @@ def register(mcp: FastMCP) -> None:
                 "color_set_lut", str(exc)
             ) from exc
 
+    @mcp.tool()
+    def color_set_lut_bulk(
+        item_names: list[str],
+        lut_path: str,
+        node_index: int = 1,
+        track_type: str = "video",
+        track_index: int = 1,
+    ) -> dict[str, bool]:
+        """Apply one LUT file to the same node on several timeline items.
+
+        Cheaper than one color_set_lut call per clip: the track is scanned
+        once and the SetLUT calls into Resolve run concurrently.
+
+        Args:
+            item_names:  Names of the timeline clips to receive the LUT.
+            lut_path:    Absolute file path to the .cube / .3dl LUT file.
+            node_index:  1-based index of the target node (default 1).
+            track_type:  Track type (default "video").
+            track_index: 1-based track number (default 1).
+
+        Returns:
+            A dict mapping each item name to True if the LUT was applied,
+            False if Resolve refused it or the call failed for that item.
+        """
+        if node_index < 1:
+            raise ResolveOperationFailed(
+                "color_set_lut_bulk",
+                "node_index must be >= 1 (1-based indexing).",
+            )
+
+        def apply(item: Any) -> bool:
+            # One failing clip must not hide the results for the others
+            try:
+                return bool(item.SetLUT(node_index, lut_path))
+            except Exception:
+                return False
+
+        try:
+            # All names are resolved before any LUT is set, so a typo fails
+            # the whole call instead of leaving a partial application
+            items = find_items(item_names, track_type, track_index)
+            try:
+                return dict(zip(items, concurrent_map(apply, list(items.values()))))
+            finally:
+                for name in items:
+                    invalidate_grade_cache(name, track_type, track_index)
+        except (ResolveNotRunning, ResolveOperationFailed):
+            raise
+        except AttributeError as exc:
+            raise ResolveNotRunning(
+                f"Lost connection to Resolve (stale reference: {exc}). Please retry."
+            ) from exc
+        except Exception as exc:
+            raise ResolveOperationFailed(
+                "color_set_lut_bulk", str(exc)
+            ) from exc
+
     @mcp.tool(annotations={"readOnlyHint": True})
     def color_get_lut(
         item_name: str,
@@ -141,9 +296,11 @@ def register(mcp: FastMCP) -> None:
                 "node_index must be >= 1 (1-based indexing).",
             )
         try:
-            item = find_item(item_name, track_type, track_index)
             # GetLUT(nodeIndex) returns the LUT path string or ""
-            lut_path: str = item.GetLUT(node_index) or ""
+            lut_path: str = _cached_read(
+                item_name, track_type, track_index, ("lut", node_index),
+                lambda item: item.GetLUT(node_index) or "",
+            )
             return lut_path
         except (ResolveNotRunning, ResolveOperationFailed):
             raise
@@ -238,18 +395,13 @@ def register(mcp: FastMCP) -> None:
             except Exception as ve:
                 raise ResolveOperationFailed(
                     "color_set_cdl",
-                    f"Invalid CDL values: {ve}. Expected format: "
+                    f"Invalid CDL values: {ve}. Slope, Offset and Power must each "
+                    "be exactly 3 RGB values. Expected format: "
                     '{"Slope": [R,G,B], "Offset": [R,G,B], "Power": [R,G,B], "Saturation": float}.',
                 ) from ve
 
-            # Build the CDL dict using validated values
-            cdl_dict = {
-                "Slope": validated.slope,
-                "Offset": validated.offset,
-                "Power": validated.power,
-                "Saturation": validated.saturation,
-            }
-            result: bool = item.SetCDL(cdl_dict)
+            result: bool = item.SetCDL(validated.to_resolve_dict())
+            invalidate_grade_cache(item_name, track_type, track_index)
             if not result:
                 raise ResolveOperationFailed(
                     "color_set_cdl",
@@ -286,9 +438,11 @@ def register(mcp: FastMCP) -> None:
             Power ([R,G,B]), Saturation (float).
         """
         try:
-            item = find_item(item_name, track_type, track_index)
             # GetCDL() returns a dict with Slope, Offset, Power, Saturation
-            cdl: dict = item.GetCDL()
+            cdl: dict = _cached_read(
+                item_name, track_type, track_index, ("cdl",),
+                lambda item: item.GetCDL(),
+            )
             return cdl
         except (ResolveNotRunning, ResolveOperationFailed):
             raise
@@ -332,6 +486,9 @@ def register(mcp: FastMCP) -> None:
                 "color_set_node_enabled",
                 "node_index must be >= 1 (1-based indexing).",
             )
+        # Known to be missing on this Resolve build: skip the lookup entirely
+        if is_unsupported("SetNodeEnabled"):
+            return False
         try:
             item = find_item(item_name, track_type, track_index)
             # SetNodeEnabled() may not be available in all Resolve versions;
@@ -342,6 +499,7 @@ def register(mcp: FastMCP) -> None:
             raise
         except AttributeError:
             # The API method doesn't exist in this Resolve version
+            mark_unsupported("SetNodeEnabled")
             return False
         except Exception as exc:
             raise ResolveOperationFailed(
@@ -372,26 +530,25 @@ def register(mcp: FastMCP) -> None:
         Returns:
             True if the grade was applied to all items successfully.
         """
+        # Validate grade_mode before hitting the API
+        if grade_mode not in _VALID_GRADE_MODES:
+            raise ResolveOperationFailed(
+                "color_apply_drx",
+                f"Invalid grade_mode {grade_mode}. Must be 0 (No keyframes), "
+                "1 (Source), or 2 (Timeline).",
+            )
         try:
-            # Validate grade_mode before hitting the API
-            if grade_mode not in (0, 1, 2):
-                raise ResolveOperationFailed(
-                    "color_apply_drx",
-                    f"Invalid grade_mode {grade_mode}. Must be 0 (No keyframes), "
-                    "1 (Source), or 2 (Timeline).",
-                )
-
             timeline = require_timeline()
 
             # Collect the TimelineItem objects for every requested name
-            items: list[Any] = []
-            for name in item_names:
-                items.append(find_item(name, track_type, track_index))
+            items = list(find_items(item_names, track_type, track_index).values())
 
             # ApplyGradeFromDRX(drxPath, gradeMode, item1, item2, ...)
             result: bool = timeline.ApplyGradeFromDRX(
                 drx_path, grade_mode, *items
             )
+            for name in item_names:
+                invalidate_grade_cache(name, track_type, track_index)
             if not result:
                 raise ResolveOperationFailed(
                     "color_apply_drx",
@@ -436,13 +593,8 @@ def register(mcp: FastMCP) -> None:
         try:
             item = find_item(item_name, track_type, track_index)
             # Apply identity CDL values to neutralise the current grade
-            identity_cdl = {
-                "Slope": [1.0, 1.0, 1.0],
-                "Offset": [0.0, 0.0, 0.0],
-                "Power": [1.0, 1.0, 1.0],
-                "Saturation": 1.0,
-            }
-            result: bool = item.SetCDL(identity_cdl)
+            result: bool = item.SetCDL(_IDENTITY_CDL)
+            invalidate_grade_cache(item_name, track_type, track_index)
             if not result:
                 raise ResolveOperationFailed(
                     "color_reset_grade",
@@ -486,6 +638,7 @@ def register(mcp: FastMCP) -> None:
             item = find_item(item_name, track_type, track_index)
             # AddVersion(versionName, versionType) — 0 = local, 1 = remote
             result: bool = item.AddVersion(version_name, 0)
+            invalidate_grade_cache(item_name, track_type, track_index)
             if not result:
                 raise ResolveOperationFailed(
                     "color_add_version",
@@ -523,9 +676,11 @@ def register(mcp: FastMCP) -> None:
             The version count as an integer.
         """
         try:
-            item = find_item(item_name, track_type, track_index)
             # GetVersionNameList(versionType) returns a list of name strings
-            versions: list[str] = item.GetVersionNameList(version_type) or []
+            versions: list[str] = _cached_read(
+                item_name, track_type, track_index, ("versions", version_type),
+                lambda item: item.GetVersionNameList(version_type) or [],
+            )
             return len(versions)
         except (ResolveNotRunning, ResolveOperationFailed):
             raise
@@ -557,8 +712,10 @@ def register(mcp: FastMCP) -> None:
             A list of version name strings.
         """
         try:
-            item = find_item(item_name, track_type, track_index)
-            versions: list[str] = item.GetVersionNameList(version_type) or []
+            versions: list[str] = _cached_read(
+                item_name, track_type, track_index, ("versions", version_type),
+                lambda item: item.GetVersionNameList(version_type) or [],
+            )
             return versions
         except (ResolveNotRunning, ResolveOperationFailed):
             raise
@@ -595,6 +752,7 @@ def register(mcp: FastMCP) -> None:
             item = find_item(item_name, track_type, track_index)
             # SetCurrentVersion(versionName, versionType) switches the active version
             result: bool = item.SetCurrentVersion(version_name, version_type)
+            invalidate_grade_cache(item_name, track_type, track_index)
             if not result:
                 raise ResolveOperationFailed(
                     "color_set_current_version",
@@ -632,9 +790,11 @@ def register(mcp: FastMCP) -> None:
             The active version name, or "" if unavailable.
         """
         try:
-            item = find_item(item_name, track_type, track_index)
             # GetCurrentVersion(versionType) returns a dict with "versionName" key
-            version_info = item.GetCurrentVersion(version_type)
+            version_info = _cached_read(
+                item_name, track_type, track_index, ("current_version", version_type),
+                lambda item: item.GetCurrentVersion(version_type),
+            )
             if isinstance(version_info, dict):
                 return version_info.get("versionName", "")
             # Some Resolve versions return the name string directly
@@ -674,6 +834,7 @@ def register(mcp: FastMCP) -> None:
             item = find_item(item_name, track_type, track_index)
             # DeleteVersion(versionName, versionType) removes a grade version
             result: bool = item.DeleteVersion(version_name, version_type)
+            invalidate_grade_cache(item_name, track_type, track_index)
             if not result:
                 raise ResolveOperationFailed(
                     "color_delete_version",
@@ -718,6 +879,7 @@ def register(mcp: FastMCP) -> None:
             item = find_item(item_name, track_type, track_index)
             # RenameVersion(oldName, newName, versionType) renames in-place
             result: bool = item.RenameVersion(old_name, new_name, version_type)
+            invalidate_grade_cache(item_name, track_type, track_index)
             if not result:
                 raise ResolveOperationFailed(
                     "color_rename_version",
@@ -763,6 +925,7 @@ def register(mcp: FastMCP) -> None:
             item = find_item(item_name, track_type, track_index)
             # LoadVersion(versionName, versionType) overwrites current grade
             result: bool = item.LoadVersion(version_name, version_type)
+            invalidate_grade_cache(item_name, track_type, track_index)
             if not result:
                 raise ResolveOperationFailed(
                     "color_load_version",
@@ -794,6 +957,8 @@ def register(mcp: FastMCP) -> None:
             Returns an empty list if the API is not supported or no
             groups are defined.
         """
+        if is_unsupported("GetColorGroupsList"):
+            return []
         try:
             api = ResolveAPI.get_instance()
             project = api.project
@@ -801,23 +966,26 @@ def register(mcp: FastMCP) -> None:
                 raise ResolveOperationFailed(
                     "color_get_group_list", "No project is currently open."
                 )
-            # GetColorGroupsList() returns a list of group info dicts
-            groups = project.GetColorGroupsList()
-            if groups is None:
-                return []
-            # Normalize: ensure each entry is a dict with at least name/id
-            result: list[dict] = []
-            for group in groups:
-                if isinstance(group, dict):
-                    result.append(group)
-                else:
-                    # Some API versions return simple strings or objects
-                    result.append({"name": str(group), "id": str(group)})
-            return result
+
+            def fetch() -> list[dict]:
+                # GetColorGroupsList() returns a list of group info dicts
+                groups = project.GetColorGroupsList()
+                if not groups:
+                    return []
+                # Normalize: ensure each entry is a dict with at least name/id.
+                # A build returns one shape for every entry, so the first
+                # entry decides, as in fairlight_get_presets.
+                if isinstance(groups[0], dict):
+                    return list(groups)
+                # Some API versions return simple strings or objects
+                return [{"name": str(g), "id": str(g)} for g in groups]
+
+            return _group_cache.get("groups", project_cache_key(project), fetch)
         except (ResolveNotRunning, ResolveOperationFailed):
             raise
         except AttributeError:
             # GetColorGroupsList() may not exist in older Resolve versions
+            mark_unsupported("GetColorGroupsList")
             return []
         except Exception as exc:
             raise ResolveOperationFailed(
@@ -835,6 +1003,8 @@ def register(mcp: FastMCP) -> None:
             True if the group was created.  Returns False if the API
             is not supported in the current Resolve version.
         """
+        if is_unsupported("AddColorGroup"):
+            return False
         try:
             api = ResolveAPI.get_instance()
             project = api.project
@@ -844,6 +1014,7 @@ def register(mcp: FastMCP) -> None:
                 )
             # AddColorGroup(groupName) creates a new project-level color group
             result: bool = project.AddColorGroup(group_name)
+            _group_cache.invalidate("groups")
             if not result:
                 raise ResolveOperationFailed(
                     "color_create_group",
@@ -855,6 +1026,7 @@ def register(mcp: FastMCP) -> None:
             raise
         except AttributeError:
             # AddColorGroup() may not exist in older Resolve versions
+            mark_unsupported("AddColorGroup")
             return False
         except Exception as exc:
             raise ResolveOperationFailed(
@@ -873,6 +1045,8 @@ def register(mcp: FastMCP) -> None:
             True if the group was deleted.  Returns False if the API
             is not supported in the current Resolve version.
         """
+        if is_unsupported("DeleteColorGroup"):
+            return False
         try:
             api = ResolveAPI.get_instance()
             project = api.project
@@ -882,6 +1056,7 @@ def register(mcp: FastMCP) -> None:
                 )
             # DeleteColorGroup(groupId) removes a color group by ID
             result: bool = project.DeleteColorGroup(group_id)
+            _group_cache.invalidate("groups")
             if not result:
                 raise ResolveOperationFailed(
                     "color_delete_group",
@@ -893,6 +1068,7 @@ def register(mcp: FastMCP) -> None:
             raise
         except AttributeError:
             # DeleteColorGroup() may not exist in older Resolve versions
+            mark_unsupported("DeleteColorGroup")
             return False
         except Exception as exc:
             raise ResolveOperationFailed(
@@ -918,6 +1094,8 @@ def register(mcp: FastMCP) -> None:
             True if the item was assigned.  Returns False if the API
             is not supported in the current Resolve version.
         """
+        if is_unsupported("SetGroupMembership"):
+            return False
         try:
             item = find_item(item_name, track_type, track_index)
             # SetGroupMembership(groupId, True) adds the item to the group
@@ -927,6 +1105,7 @@ def register(mcp: FastMCP) -> None:
             raise
         except AttributeError:
             # SetGroupMembership() may not exist in older Resolve versions
+            mark_unsupported("SetGroupMembership")
             return False
         except Exception as exc:
             raise ResolveOperationFailed(
@@ -952,6 +1131,8 @@ def register(mcp: FastMCP) -> None:
             True if the item was removed.  Returns False if the API
             is not supported in the current Resolve version.
         """
+        if is_unsupported("SetGroupMembership"):
+            return False
         try:
             item = find_item(item_name, track_type, track_index)
             # SetGroupMembership(groupId, False) removes the item from the group
@@ -961,12 +1142,121 @@ def register(mcp: FastMCP) -> None:
             raise
         except AttributeError:
             # SetGroupMembership() may not exist in older Resolve versions
+            mark_unsupported("SetGroupMembership")
             return False
         except Exception as exc:
             raise ResolveOperationFailed(
                 "color_remove_from_group", str(exc)
             ) from exc
 
+    @mcp.tool()
+    def color_assign_to_group_bulk(
+        item_names: list[str],
+        group_id: str,
+        track_type: str = "video",
+        track_index: int = 1,
+    ) -> dict[str, bool]:
+        """Assign several timeline items to a color group in one call.
+
+        Cheaper than one color_assign_to_group call per clip: the track is
+        scanned once and the membership calls into Resolve run concurrently.
+
+        Args:
+            item_names:  Names of the timeline clips to assign.
+            group_id:    ID of the target color group (from color_get_group_list).
+            track_type:  Track type (default "video").
+            track_index: 1-based track number (default 1).
+
+        Returns:
+            A dict mapping each item name to True if it was assigned, False
+            if Resolve refused or does not support group membership.
+        """
+        return _set_group_membership(
+            "color_assign_to_group_bulk", item_names, group_id, True,
+            track_type, track_index,
+        )
+
+    @mcp.tool()
+    def color_remove_from_group_bulk(
+        item_names: list[str],
+        group_id: str,
+        track_type: str = "video",
+        track_index: int = 1,
+    ) -> dict[str, bool]:
+        """Remove several timeline items from a color group in one call.
+
+        Args:
+            item_names:  Names of the timeline clips to remove.
+            group_id:    ID of the color group to leave (from color_get_group_list).
+            track_type:  Track type (default "video").
+            track_index: 1-based track number (default 1).
+
+        Returns:
+            A dict mapping each item name to True if it was removed, False
+            if Resolve refused or does not support group membership.
+        """
+        return _set_group_membership(
+            "color_remove_from_group_bulk", item_names, group_id, False,
+            track_type, track_index,
+        )
+
+    @mcp.tool()
+    def color_assign_to_groups(
+        assignments: dict[str, list[str]],
+        track_type: str = "video",
+        track_index: int = 1,
+    ) -> dict[str, dict[str, bool]]:
+        """Assign timeline items to one or more color groups each, in one call.
+
+        Every item is looked up once, however many groups it joins, and the
+        items are processed concurrently.
+
+        Args:
+            assignments: Mapping of timeline clip name to the IDs of the
+                         groups it should join (from color_get_group_list),
+                         e.g. {"Clip A": ["group-001", "group-002"]}.
+            track_type:  Track type (default "video").
+            track_index: 1-based track number (default 1).
+
+        Returns:
+            A dict mapping each item name to a dict of group ID -> True if
+            the item was assigned, False if Resolve refused or does not
+            support group membership.
+        """
+        if is_unsupported("SetGroupMembership"):
+            return {
+                name: dict.fromkeys(group_ids, False)
+                for name, group_ids in assignments.items()
+            }
+
+        def assign(entry: tuple[str, Any]) -> dict[str, bool]:
+            name, item = entry
+            # One item handle, so its groups are set in order
+            results: dict[str, bool] = {}
+            for group_id in assignments[name]:
+                try:
+                    results[group_id] = bool(item.SetGroupMembership(group_id, True))
+                except AttributeError:
+                    # SetGroupMembership() may not exist in older Resolve versions
+                    mark_unsupported("SetGroupMembership")
+                    results[group_id] = False
+            return results
+
+        try:
+            # All names are resolved before any membership changes
+            items = find_items(assignments, track_type, track_index)
+            return dict(zip(items, concurrent_map(assign, list(items.items()))))
+        except (ResolveNotRunning, ResolveOperationFailed):
+            raise
+        except AttributeError as exc:
+            raise ResolveNotRunning(
+                f"Lost connection to Resolve (stale reference: {exc}). Please retry."
+            ) from exc
+        except Exception as exc:
+            raise ResolveOperationFailed(
+                "color_assign_to_groups", str(exc)
+            ) from exc
+
     # ==================================================================
     # Node labels
     # ==================================================================
@@ -994,10 +1284,16 @@ def register(mcp: FastMCP) -> None:
                 "color_get_node_label",
                 "node_index must be >= 1 (1-based indexing).",
             )
+        if is_unsupported("GetNodeLabel"):
+            raise _not_available("color_get_node_label", "GetNodeLabel")
         try:
             item = find_item(item_name, track_type, track_index)
-            # GetNodeLabel(nodeIndex) returns the label string for the node
-            label: str = item.GetNodeLabel(node_index) or ""
+            try:
+                # GetNodeLabel(nodeIndex) returns the label string for the node
+                label: str = item.GetNodeLabel(node_index) or ""
+            except AttributeError as exc:
+                mark_unsupported("GetNodeLabel")
+                raise _not_available("color_get_node_label", "GetNodeLabel") from exc
             return label
         except (ResolveNotRunning, ResolveOperationFailed):
             raise
@@ -1035,10 +1331,16 @@ def register(mcp: FastMCP) -> None:
                 "color_set_node_label",
                 "node_index must be >= 1 (1-based indexing).",
             )
+        if is_unsupported("SetNodeLabel"):
+            raise _not_available("color_set_node_label", "SetNodeLabel")
         try:
             item = find_item(item_name, track_type, track_index)
-            # SetNodeLabel(nodeIndex, label) assigns a label to the node
-            result: bool = item.SetNodeLabel(node_index, label)
+            try:
+                # SetNodeLabel(nodeIndex, label) assigns a label to the node
+                result: bool = item.SetNodeLabel(node_index, label)
+            except AttributeError as exc:
+                mark_unsupported("SetNodeLabel")
+                raise _not_available("color_set_node_label", "SetNodeLabel") from exc
             if not result:
                 raise ResolveOperationFailed(
                     "color_set_node_label",
@@ -1056,3 +1358,135 @@ def register(mcp: FastMCP) -> None:
             raise ResolveOperationFailed(
                 "color_set_node_label", str(exc)
             ) from exc
+
+    @mcp.tool()
+    def color_set_node_labels(
+        item_name: str,
+        labels: dict[int, str],
+        track_type: str = "video",
+        track_index: int = 1,
+    ) -> dict[int, bool]:
+        """Set the labels of several nodes on one timeline item in one call.
+
+        Cheaper than one color_set_node_label call per node: the item is
+        looked up once and only the SetNodeLabel calls reach Resolve.
+
+        Args:
+            item_name:   Exact name of the timeline clip.
+            labels:      Mapping of 1-based node index to the label to set,
+                         e.g. {1: "Balance", 2: "Look"}.  JSON object keys
+                         arrive as strings ("1") and are converted to ints.
+            track_type:  Track type (default "video").
+            track_index: 1-based track number (default 1).
+
+        Returns:
+            A dict mapping each node index to True if its label was set,
+            False if Resolve refused it.
+        """
+        bad = sorted(index for index in labels if index < 1)
+        if bad:
+            raise ResolveOperationFailed(
+                "color_set_node_labels",
+                f"node indices must be >= 1 (1-based indexing), got {bad}.",
+            )
+        if is_unsupported("SetNodeLabel"):
+            raise _not_available("color_set_node_labels", "SetNodeLabel")
+        try:
+            item = find_item(item_name, track_type, track_index)
+            try:
+                # One node graph, so the labels are set in order, not concurrently
+                return {
+                    index: bool(item.SetNodeLabel(index, label))
+                    for index, label in labels.items()
+                }
+            except AttributeError as exc:
+                mark_unsupported("SetNodeLabel")
+                raise _not_available("color_set_node_labels", "SetNodeLabel") from exc
+        except (ResolveNotRunning, ResolveOperationFailed):
+            raise
+        except AttributeError as exc:
+            raise ResolveNotRunning(
+                f"Lost connection to Resolve (stale reference: {exc}). Please retry."
+            ) from exc
+        except Exception as exc:
+            raise ResolveOperationFailed(
+                "color_set_node_labels", str(exc)
+            ) from exc
+
+    # ==================================================================
+    # Grade summary
+    # ==================================================================
+
+    @mcp.tool(annotations={"readOnlyHint": True})
+    def color_get_summary(
+        item_name: str,
+        track_type: str = "video",
+        track_index: int = 1,
+    ) -> dict:
+        """Return a clip's grade at a glance: node count, CDL, version and LUT.
+
+        One lookup and one cache entry instead of four tool calls, so prefer
+        this over color_get_num_nodes, color_get_cdl, color_get_current_version
+        and color_get_lut when more than one of them is needed.
+
+        Args:
+            item_name:   Exact name of the timeline clip.
+            track_type:  Track type (default "video").
+            track_index: 1-based track number (default 1).
+
+        Returns:
+            A dict with keys: num_nodes (int), cdl (dict), current_version
+            (local version name, "" if unavailable) and lut (LUT path on
+            node 1, "" if none).
+        """
+
+        def read(item: Any) -> dict:
+            # Version and LUT getters are missing on some older Resolve builds
+            get_version = getattr(item, "GetCurrentVersion", None)
+            get_lut = getattr(item, "GetLUT", None)
+            version_info = get_version(0) if get_version is not None else None
+            if isinstance(version_info, dict):
+                version = version_info.get("versionName", "")
+            else:
+                version = str(version_info) if version_info else ""
+            return {
+                "num_nodes": item.GetNumNodes(),
+                "cdl": item.GetCDL(),
+                "current_version": version,
+                "lut": (get_lut(1) if get_lut is not None else "") or "",
+            }
+
+        try:
+            summary: dict = _cached_read(
+                item_name, track_type, track_index, ("summary",), read,
+            )
+            return summary
+        except (ResolveNotRunning, ResolveOperationFailed):
+            raise
+        except AttributeError as exc:
+            raise ResolveNotRunning(
+                f"Lost connection to Resolve (stale reference: {exc}). Please retry."
+            ) from exc
+        except Exception as exc:
+            raise ResolveOperationFailed(
+                "color_get_summary", str(exc)
+            ) from exc
+
+    # ==================================================================
+    # Read cache
+    # ==================================================================
+
+    @mcp.tool()
+    def color_cache_clear() -> int:
+        """Drop all cached results of the read-only color tools.
+
+        Node counts, LUT paths, CDL values and grade versions are cached for
+        a couple of seconds, the color group list for 30 seconds, and both
+        are invalidated by this server's own color tools.  Call this after
+        changing grades or groups directly in Resolve's UI to force the
+        next read to query Resolve again.
+
+        Returns:
+            The number of cached entries that were dropped.
+        """
+        return _grade_cache.clear() + _group_cache.clear()
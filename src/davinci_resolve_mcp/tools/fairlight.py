@@ -13,10 +13,59 @@ return a clear error rather than crashing the server.
 
 from __future__ import annotations
 
+from typing import Any
+
 from fastmcp import FastMCP
 
 from ..exceptions import ResolveNotRunning, ResolveOperationFailed
 from ..resolve_api import ResolveAPI
+from ._helpers import (
+    TTLCache,
+    invalidate_item_index,
+    is_unsupported,
+    mark_unsupported,
+    project_cache_key,
+)
+
+# The preset list only changes when presets are installed, so it is cached
+# per project_cache_key() (handles are re-fetched after every health check).
+_PRESET_CACHE_TTL = 30.0
+_preset_cache = TTLCache(_PRESET_CACHE_TTL)
+
+# is_unsupported() keys: the per-track ApplyFairlightPreset(name, index) form
+_APPLY_PRESET_PER_TRACK = "ApplyFairlightPreset(name, track_index)"
+# ... and for AppendToTimeline with clip-info dicts instead of bare items
+_APPEND_CLIP_INFO = "AppendToTimeline(clip_info)"
+
+
+def _append_audio(pool: Any, imported: list, track_index: int) -> Any:
+    """Append imported audio clips to the current timeline in one call.
+
+    AppendToTimeline places clips at the end of the timeline on appropriate
+    tracks.  For audio-only files, Resolve routes them to audio tracks
+    automatically.  The clip-info form with "trackIndex" is tried first to
+    honour the caller's track preference; builds that reject it are
+    remembered and go straight to the plain list of items.
+
+    Returns whatever AppendToTimeline returned (falsy on failure).
+    """
+    try:
+        if not is_unsupported(_APPEND_CLIP_INFO):
+            clip_info = [
+                # Some Resolve versions support a dict with "trackIndex";
+                # mediaType 2 = audio in some API versions
+                {"mediaPoolItem": item, "trackIndex": track_index, "mediaType": 2}
+                for item in imported
+            ]
+            try:
+                return pool.AppendToTimeline(clip_info)
+            except (TypeError, AttributeError):
+                mark_unsupported(_APPEND_CLIP_INFO)
+        # Fall back to the simple list-of-items approach
+        return pool.AppendToTimeline(imported)
+    finally:
+        # The new clips change the tracks find_item() has indexed
+        invalidate_item_index()
 
 
 # ---------------------------------------------------------------------------
@@ -73,27 +122,8 @@ def register(mcp: FastMCP) -> None:
                     "Check that the file exists and is a supported audio format.",
                 )
 
-            # Step 2: Append the imported clip to the current timeline.
-            # AppendToTimeline places clips at the end of the timeline on
-            # appropriate tracks.  For audio-only files, Resolve routes them
-            # to audio tracks automatically.
-            #
-            # We also attempt SetTrackIndex if the API supports it, to
-            # honour the caller's track preference.
-            clip_info = [{"mediaPoolItem": item} for item in imported]
-
-            # Try the extended signature with track targeting first
-            try:
-                # Some Resolve versions support a dict with "trackIndex"
-                for info in clip_info:
-                    info["trackIndex"] = track_index
-                    info["mediaType"] = 2  # 2 = audio in some API versions
-
-                result = pool.AppendToTimeline(clip_info)
-            except (TypeError, AttributeError):
-                # Fall back to the simple list-of-items approach
-                result = pool.AppendToTimeline(imported)
-
+            # Step 2: Append the imported clip to the current timeline
+            result = _append_audio(pool, imported, track_index)
             if not result:
                 raise ResolveOperationFailed(
                     "fairlight_insert_audio",
@@ -113,6 +143,76 @@ def register(mcp: FastMCP) -> None:
                 "fairlight_insert_audio", str(exc)
             ) from exc
 
+    @mcp.tool()
+    def fairlight_insert_audio_batch(
+        file_paths: list[str], track_index: int = 1
+    ) -> dict:
+        """Import several audio files and append them to the timeline together.
+
+        Same as calling fairlight_insert_audio once per file, but the files
+        are imported with one ImportMedia call and appended with one
+        AppendToTimeline call, in the order given.
+
+        Args:
+            file_paths:  Absolute paths to the audio files.
+            track_index: 1-based audio track index hint, applied to every
+                         file (see fairlight_insert_audio).
+
+        Returns:
+            A dict with "requested" (number of paths given) and "imported"
+            (number Resolve imported and appended).  Files that fail to
+            import are skipped; the call only fails if none import.
+        """
+        if not file_paths:
+            raise ResolveOperationFailed(
+                "fairlight_insert_audio_batch", "file_paths must not be empty."
+            )
+        try:
+            api = ResolveAPI.get_instance()
+
+            timeline = api.timeline
+            if timeline is None:
+                raise ResolveOperationFailed(
+                    "fairlight_insert_audio_batch",
+                    "No timeline is currently open. Create or open a timeline first.",
+                )
+
+            pool = api.media_pool
+            if pool is None:
+                raise ResolveOperationFailed(
+                    "fairlight_insert_audio_batch",
+                    "Media Pool is not available. Is a project open?",
+                )
+
+            # ImportMedia() returns only the items that imported successfully
+            imported = pool.ImportMedia(list(file_paths))
+            if not imported:
+                raise ResolveOperationFailed(
+                    "fairlight_insert_audio_batch",
+                    "Failed to import any of the audio files. Check that the "
+                    "files exist and are a supported audio format.",
+                )
+
+            if not _append_audio(pool, imported, track_index):
+                raise ResolveOperationFailed(
+                    "fairlight_insert_audio_batch",
+                    f"Imported {len(imported)} audio file(s) but failed to "
+                    "append them to the timeline.",
+                )
+
+            return {"requested": len(file_paths), "imported": len(imported)}
+
+        except (ResolveNotRunning, ResolveOperationFailed):
+            raise
+        except AttributeError as exc:
+            raise ResolveNotRunning(
+                f"Lost connection to Resolve (stale reference: {exc}). Please retry."
+            ) from exc
+        except Exception as exc:
+            raise ResolveOperationFailed(
+                "fairlight_insert_audio_batch", str(exc)
+            ) from exc
+
     # ------------------------------------------------------------------
     # 2. List available Fairlight presets
     # ------------------------------------------------------------------
@@ -123,6 +223,8 @@ def register(mcp: FastMCP) -> None:
         Returns preset names as strings.  Returns an empty list if the
         Fairlight preset API is not available in this Resolve version.
         """
+        if is_unsupported("GetFairlightPresetList"):
+            return []
         try:
             api = ResolveAPI.get_instance()
             project = api.project
@@ -132,21 +234,25 @@ def register(mcp: FastMCP) -> None:
                     "No project is currently open.",
                 )
 
-            # GetFairlightPresetList is non-standard and may not exist
-            # in all Resolve versions.  Return an empty list gracefully.
-            try:
-                presets = project.GetFairlightPresetList()
-            except AttributeError:
-                return []
+            def fetch() -> list[str]:
+                # GetFairlightPresetList is non-standard and may not exist
+                # in all Resolve versions.  Return an empty list gracefully.
+                try:
+                    presets = project.GetFairlightPresetList()
+                except AttributeError:
+                    mark_unsupported("GetFairlightPresetList")
+                    return []
+
+                if not presets:
+                    return []
 
-            if not presets:
-                return []
+                # The API may return a list of strings or a list of dicts.
+                # Normalise to a plain list of names.
+                if isinstance(presets[0], dict):
+                    return [p.get("Name", str(p)) for p in presets]
+                return [str(p) for p in presets]
 
-            # The API may return a list of strings or a list of dicts.
-            # Normalise to a plain list of names.
-            if isinstance(presets[0], dict):
-                return [p.get("Name", str(p)) for p in presets]
-            return [str(p) for p in presets]
+            return _preset_cache.get("presets", project_cache_key(project), fetch)
 
         except (ResolveNotRunning, ResolveOperationFailed):
             raise
@@ -175,6 +281,11 @@ def register(mcp: FastMCP) -> None:
         Returns True if the preset was applied successfully.
         This method may not be available in all Resolve versions.
         """
+        if is_unsupported("ApplyFairlightPreset"):
+            raise ResolveOperationFailed(
+                "fairlight_apply_preset",
+                "ApplyFairlightPreset() is not available in this Resolve version.",
+            )
         try:
             api = ResolveAPI.get_instance()
             project = api.project
@@ -186,16 +297,20 @@ def register(mcp: FastMCP) -> None:
 
             # Try applying with a track_index argument first (some versions
             # support per-track targeting), then fall back to global application.
+            # Builds that reject the two-argument form are remembered so they
+            # go straight to the single-argument call.
             applied = False
 
             try:
-                result = project.ApplyFairlightPreset(preset_name, track_index)
-                if result:
-                    applied = True
+                if not is_unsupported(_APPLY_PRESET_PER_TRACK):
+                    result = project.ApplyFairlightPreset(preset_name, track_index)
+                    if result:
+                        applied = True
             except TypeError:
                 # Two-argument version not supported — try single-argument
-                pass
+                mark_unsupported(_APPLY_PRESET_PER_TRACK)
             except AttributeError as exc:
+                mark_unsupported("ApplyFairlightPreset")
                 raise ResolveOperationFailed(
                     "fairlight_apply_preset",
                     "ApplyFairlightPreset() is not available in this Resolve version.",
@@ -207,6 +322,7 @@ def register(mcp: FastMCP) -> None:
                     if result:
                         applied = True
                 except AttributeError as exc:
+                    mark_unsupported("ApplyFairlightPreset")
                     raise ResolveOperationFailed(
                         "fairlight_apply_preset",
                         "ApplyFairlightPreset() is not available in this Resolve version.",
@@ -13,13 +13,81 @@ so MCP clients can cache or batch them.
 
 from __future__ import annotations
 
+import os
 from typing import Any
 
 from fastmcp import FastMCP
 
 from ..exceptions import ResolveNotRunning, ResolveOperationFailed
-from ..resolve_api import ResolveAPI
-from ._helpers import find_item, require_media_pool, require_timeline
+from ._helpers import (
+    TTLCache,
+    concurrent_map,
+    find_item,
+    invalidate_item_index,
+    require_media_pool,
+    require_timeline,
+)
+
+# Composition handles from GetFusionCompByName() are cached briefly, grouped
+# per timeline item, so "get comp info, then list its tools" looks the comp
+# up once.  Tools that add, import, delete or rename comps invalidate them.
+_COMP_CACHE_TTL = 2.0
+_comp_cache = TTLCache(_COMP_CACHE_TTL)
+
+
+def _get_comp(
+    item_name: str,
+    comp_name: str,
+    track_type: str,
+    track_index: int,
+    item: Any = None,
+) -> Any:
+    """Return the named Fusion comp on a timeline item (None if absent), cached.
+
+    The current timeline handle is part of the key, like the color tools'
+    grade cache, so a timeline switch never serves another timeline's comp.
+    Pass *item* when the caller already looked it up, so a miss does not
+    look it up again.
+    """
+    timeline = require_timeline()
+
+    def fetch() -> Any:
+        target = item
+        if target is None:
+            target = find_item(item_name, track_type, track_index)
+        return target.GetFusionCompByName(comp_name)
+
+    return _comp_cache.get(
+        (item_name, track_type, track_index), (timeline, comp_name), fetch
+    )
+
+
+def _append_fusion_clips(media_type: str, names: list[str]) -> list | None:
+    """Append Fusion generators or titles to the timeline in one call.
+
+    AppendToTimeline() accepts a list of dicts describing media to add; for
+    generators and titles the template name goes in "generatorType".  All
+    *names* share a single scripting call and are placed in the order given.
+
+    Returns whatever AppendToTimeline returned: a list of the new timeline
+    items (possibly empty), or None on failure.
+    """
+    pool = require_media_pool()
+    try:
+        return pool.AppendToTimeline(
+            [{"mediaType": media_type, "generatorType": name} for name in names]
+        )
+    finally:
+        # The new clips change the tracks find_item() has indexed
+        invalidate_item_index()
+
+
+def _tool_name(tool_obj: Any) -> str:
+    """Return a Fusion tool's TOOLS_Name, falling back to its str()."""
+    try:
+        return tool_obj.GetAttrs("TOOLS_Name") or str(tool_obj)
+    except AttributeError:
+        return str(tool_obj)
 
 
 # ---------------------------------------------------------------------------
@@ -117,9 +185,8 @@ def register(mcp: FastMCP) -> None:
             or None if not found.
         """
         try:
-            item = find_item(item_name, track_type, track_index)
             # GetFusionCompByName() returns a Fusion comp object or None
-            comp = item.GetFusionCompByName(comp_name)
+            comp = _get_comp(item_name, comp_name, track_type, track_index)
             if comp is None:
                 return None
 
@@ -144,6 +211,60 @@ def register(mcp: FastMCP) -> None:
                 "fusion_get_comp", str(exc)
             ) from exc
 
+    @mcp.tool(annotations={"readOnlyHint": True})
+    def fusion_describe_item(
+        item_name: str,
+        include_tool_counts: bool = False,
+        track_type: str = "video",
+        track_index: int = 1,
+    ) -> dict:
+        """Return a timeline item's Fusion compositions in one call.
+
+        Combines fusion_get_comp_count, fusion_get_comp_names and (optionally)
+        fusion_get_comp for every composition, sharing a single item lookup
+        and a single name-list read.
+
+        Args:
+            item_name:           Exact name of the timeline clip.
+            include_tool_counts: Also open each composition and count its
+                                 tools (one extra call per composition).
+            track_type:          Track type (default "video").
+            track_index:         1-based track number (default 1).
+
+        Returns:
+            A dict with "count" (int) and "names" (list of str).  With
+            include_tool_counts, also "tool_counts" mapping each composition
+            name to its tool count (-1 if tool listing is unavailable).
+        """
+        try:
+            item = find_item(item_name, track_type, track_index)
+            names: list[str] = item.GetFusionCompNameList() or []
+            info: dict = {"count": len(names), "names": names}
+            if include_tool_counts:
+                tool_counts: dict[str, int] = {}
+                for comp_name in names:
+                    comp = _get_comp(
+                        item_name, comp_name, track_type, track_index, item
+                    )
+                    try:
+                        tools = comp.GetToolList()
+                        tool_counts[comp_name] = len(tools) if tools else 0
+                    except Exception:
+                        # Same fallback as fusion_get_comp
+                        tool_counts[comp_name] = -1
+                info["tool_counts"] = tool_counts
+            return info
+        except (ResolveNotRunning, ResolveOperationFailed):
+            raise
+        except AttributeError as exc:
+            raise ResolveNotRunning(
+                f"Lost connection to Resolve (stale reference: {exc}). Please retry."
+            ) from exc
+        except Exception as exc:
+            raise ResolveOperationFailed(
+                "fusion_describe_item", str(exc)
+            ) from exc
+
     # ==================================================================
     # Composition CRUD
     # ==================================================================
@@ -159,12 +280,7 @@ def register(mcp: FastMCP) -> None:
             True if a new composition was added.
         """
         try:
-            api = ResolveAPI.get_instance()
-            timeline = api.timeline
-            if timeline is None:
-                raise ResolveOperationFailed(
-                    "fusion_add_comp", "No timeline is currently open."
-                )
+            timeline = require_timeline()
 
             # Get the video item under the playhead
             current_item = timeline.GetCurrentVideoItem()
@@ -177,6 +293,8 @@ def register(mcp: FastMCP) -> None:
 
             # AddFusionComp() creates a new composition on the item
             result: bool = current_item.AddFusionComp()
+            # The item is not looked up by name here, so drop every entry
+            _comp_cache.clear()
             if not result:
                 raise ResolveOperationFailed(
                     "fusion_add_comp",
@@ -212,10 +330,16 @@ def register(mcp: FastMCP) -> None:
         Returns:
             True if the composition was imported successfully.
         """
+        # Resolve reads the file itself; catch a bad path before the round trip
+        if not os.path.isfile(comp_path):
+            raise ResolveOperationFailed(
+                "fusion_import_comp", f"Comp file '{comp_path}' does not exist."
+            )
         try:
             item = find_item(item_name, track_type, track_index)
             # ImportFusionComp(filePath) loads a .comp file onto the item
             result: bool = item.ImportFusionComp(comp_path)
+            _comp_cache.invalidate((item_name, track_type, track_index))
             if not result:
                 raise ResolveOperationFailed(
                     "fusion_import_comp",
@@ -254,6 +378,12 @@ def register(mcp: FastMCP) -> None:
         Returns:
             True if the composition was exported successfully.
         """
+        export_dir = os.path.dirname(export_path) or "."
+        if not os.path.isdir(export_dir) or not os.access(export_dir, os.W_OK):
+            raise ResolveOperationFailed(
+                "fusion_export_comp",
+                f"Directory '{export_dir}' does not exist or is not writable.",
+            )
         try:
             item = find_item(item_name, track_type, track_index)
             # ExportFusionComp(compName, filePath) writes the comp to disk
@@ -298,6 +428,7 @@ def register(mcp: FastMCP) -> None:
             item = find_item(item_name, track_type, track_index)
             # DeleteFusionCompByName(compName) removes the named composition
             result: bool = item.DeleteFusionCompByName(comp_name)
+            _comp_cache.invalidate((item_name, track_type, track_index))
             if not result:
                 raise ResolveOperationFailed(
                     "fusion_delete_comp",
@@ -340,6 +471,7 @@ def register(mcp: FastMCP) -> None:
             item = find_item(item_name, track_type, track_index)
             # RenameFusionCompByName(oldName, newName) renames in-place
             result: bool = item.RenameFusionCompByName(old_name, new_name)
+            _comp_cache.invalidate((item_name, track_type, track_index))
             if not result:
                 raise ResolveOperationFailed(
                     "fusion_rename_comp",
@@ -377,15 +509,10 @@ def register(mcp: FastMCP) -> None:
             True if the generator was inserted successfully.
         """
         try:
-            pool = require_media_pool()
-            # AppendToTimeline() accepts a list of dicts describing media to add.
-            # For generators, use mediaType "generator" and generatorType for the name.
             # AppendToTimeline() returns a list (empty = no items added,
             # non-empty = success) or None on failure.  Use `is None` to
             # distinguish actual failure from an empty list.
-            result = pool.AppendToTimeline(
-                [{"mediaType": "generator", "generatorType": generator_name}]
-            )
+            result = _append_fusion_clips("generator", [generator_name])
             if result is None:
                 raise ResolveOperationFailed(
                     "fusion_insert_generator",
@@ -404,6 +531,46 @@ def register(mcp: FastMCP) -> None:
                 "fusion_insert_generator", str(exc)
             ) from exc
 
+    @mcp.tool()
+    def fusion_insert_generators(generator_names: list[str]) -> dict:
+        """Insert several Fusion generators into the current timeline at once.
+
+        Same as calling fusion_insert_generator once per name, but all of
+        them are appended with a single AppendToTimeline call, in the order
+        given.
+
+        Args:
+            generator_names: Names of the Fusion generators to insert,
+                             e.g. ["Fusion Composition", "Solid Color"].
+
+        Returns:
+            A dict with "requested" (number of names given) and "inserted"
+            (number of timeline items Resolve created).
+        """
+        if not generator_names:
+            raise ResolveOperationFailed(
+                "fusion_insert_generators", "generator_names must not be empty."
+            )
+        try:
+            result = _append_fusion_clips("generator", generator_names)
+            if result is None:
+                raise ResolveOperationFailed(
+                    "fusion_insert_generators",
+                    "Failed to insert generators. Check the generator names "
+                    "match available Fusion generators.",
+                )
+            return {"requested": len(generator_names), "inserted": len(result)}
+        except (ResolveNotRunning, ResolveOperationFailed):
+            raise
+        except AttributeError as exc:
+            raise ResolveNotRunning(
+                f"Lost connection to Resolve (stale reference: {exc}). Please retry."
+            ) from exc
+        except Exception as exc:
+            raise ResolveOperationFailed(
+                "fusion_insert_generators", str(exc)
+            ) from exc
+
     @mcp.tool()
     def fusion_insert_title(title_name: str) -> bool:
         """Insert a Fusion title into the current timeline.
@@ -419,14 +586,8 @@ def register(mcp: FastMCP) -> None:
             True if the title was inserted successfully.
         """
         try:
-            pool = require_media_pool()
             # Same pattern as generators, but with mediaType "title"
-            # AppendToTimeline() returns a list (empty = no items added,
-            # non-empty = success) or None on failure.  Use `is None` to
-            # distinguish actual failure from an empty list.
-            result = pool.AppendToTimeline(
-                [{"mediaType": "title", "generatorType": title_name}]
-            )
+            result = _append_fusion_clips("title", [title_name])
             if result is None:
                 raise ResolveOperationFailed(
                     "fusion_insert_title",
@@ -445,6 +606,45 @@ def register(mcp: FastMCP) -> None:
                 "fusion_insert_title", str(exc)
             ) from exc
 
+    @mcp.tool()
+    def fusion_insert_titles(title_names: list[str]) -> dict:
+        """Insert several Fusion titles into the current timeline at once.
+
+        Same as calling fusion_insert_title once per name, but all of them
+        are appended with a single AppendToTimeline call, in the order given.
+
+        Args:
+            title_names: Names of the Fusion title templates to insert,
+                         e.g. ["Text+", "Scroll"].
+
+        Returns:
+            A dict with "requested" (number of names given) and "inserted"
+            (number of timeline items Resolve created).
+        """
+        if not title_names:
+            raise ResolveOperationFailed(
+                "fusion_insert_titles", "title_names must not be empty."
+            )
+        try:
+            result = _append_fusion_clips("title", title_names)
+            if result is None:
+                raise ResolveOperationFailed(
+                    "fusion_insert_titles",
+                    "Failed to insert titles. Check the title names match "
+                    "available Fusion titles.",
+                )
+            return {"requested": len(title_names), "inserted": len(result)}
+        except (ResolveNotRunning, ResolveOperationFailed):
+            raise
+        except AttributeError as exc:
+            raise ResolveNotRunning(
+                f"Lost connection to Resolve (stale reference: {exc}). Please retry."
+            ) from exc
+        except Exception as exc:
+            raise ResolveOperationFailed(
+                "fusion_insert_titles", str(exc)
+            ) from exc
+
     # ==================================================================
     # Tool listing within a composition
     # ==================================================================
@@ -470,8 +670,7 @@ def register(mcp: FastMCP) -> None:
             or the API does not support tool listing.
         """
         try:
-            item = find_item(item_name, track_type, track_index)
-            comp = item.GetFusionCompByName(comp_name)
+            comp = _get_comp(item_name, comp_name, track_type, track_index)
             if comp is None:
                 raise ResolveOperationFailed(
                     "fusion_get_tool_list",
@@ -484,25 +683,17 @@ def register(mcp: FastMCP) -> None:
             if not tools:
                 return []
 
-            tool_names: list[str] = []
             if isinstance(tools, dict):
                 # Dict maps internal IDs to tool objects; extract the name of each
-                for tool_obj in tools.values():
-                    try:
-                        tool_names.append(tool_obj.GetAttrs("TOOLS_Name") or str(tool_obj))
-                    except AttributeError:
-                        tool_names.append(str(tool_obj))
+                tool_objs = list(tools.values())
             elif isinstance(tools, (list, tuple)):
-                for tool_obj in tools:
-                    try:
-                        tool_names.append(tool_obj.GetAttrs("TOOLS_Name") or str(tool_obj))
-                    except AttributeError:
-                        tool_names.append(str(tool_obj))
+                tool_objs = list(tools)
             else:
                 # Unexpected type; return a best-effort representation
-                tool_names.append(str(tools))
+                return [str(tools)]
 
-            return tool_names
+            # Each GetAttrs() is its own round trip, so overlap them
+            return concurrent_map(_tool_name, tool_objs)
         except (ResolveNotRunning, ResolveOperationFailed):
             raise
         except AttributeError as exc:
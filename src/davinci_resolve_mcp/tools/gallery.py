@@ -18,6 +18,7 @@ from fastmcp import FastMCP
 
 from ..exceptions import ResolveNotRunning, ResolveOperationFailed
 from ..resolve_api import ResolveAPI
+from ._helpers import invalidate_grade_cache
 
 
 # ---------------------------------------------------------------------------
@@ -685,11 +686,13 @@ def register(mcp: FastMCP) -> None:
             applied_count = 0
 
             for item in items:
-                if item.GetName() in target_names:
+                name = item.GetName()
+                if name in target_names:
                     try:
                         # ApplyGradeFromGalleryStill is the standard method
                         # for applying a gallery grade to a timeline item.
                         result = item.ApplyGradeFromGalleryStill(still)
+                        invalidate_grade_cache(name, track_type, track_index)
                         if result:
                             applied_count += 1
                     except AttributeError:
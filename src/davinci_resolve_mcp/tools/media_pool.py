@@ -14,6 +14,7 @@ from fastmcp import FastMCP
 
 from ..exceptions import ResolveNotRunning, ResolveOperationFailed
 from ..resolve_api import ResolveAPI
+from ._helpers import invalidate_item_index, paginate
 
 
 # ---------------------------------------------------------------------------
@@ -47,6 +48,21 @@ def _require_current_folder() -> Any:
     return folder
 
 
+def _describe_clip(clip: Any) -> dict:
+    """Summarise a Media Pool clip for paginated listings."""
+    # Extract commonly useful clip properties safely
+    props = clip.GetClipProperty() if clip else {}
+    if not isinstance(props, dict):
+        props = {}
+    return {
+        "name": clip.GetName() if clip else "Unknown",
+        "clip_color": props.get("Clip Color", ""),
+        "duration": props.get("Duration", ""),
+        "fps": props.get("FPS", ""),
+        "resolution": props.get("Resolution", ""),
+    }
+
+
 def _find_subfolder_by_name(parent_folder: Any, name: str) -> Any | None:
     """Search immediate children of *parent_folder* for a subfolder matching *name*.
 
@@ -284,36 +300,7 @@ def register(mcp: FastMCP) -> None:
         try:
             folder = _require_current_folder()
 
-            all_clips = folder.GetClipList() or []
-            total = len(all_clips)
-
-            # Slice the list for the requested page
-            page = all_clips[offset : offset + limit]
-
-            items = []
-            for clip in page:
-                # Extract commonly useful clip properties safely
-                props = clip.GetClipProperty() if clip else {}
-                if not isinstance(props, dict):
-                    props = {}
-
-                items.append(
-                    {
-                        "name": clip.GetName() if clip else "Unknown",
-                        "clip_color": props.get("Clip Color", ""),
-                        "duration": props.get("Duration", ""),
-                        "fps": props.get("FPS", ""),
-                        "resolution": props.get("Resolution", ""),
-                    }
-                )
-
-            return {
-                "items": items,
-                "total": total,
-                "offset": offset,
-                "limit": limit,
-                "has_more": (offset + limit) < total,
-            }
+            return paginate(folder.GetClipList(), offset, limit, _describe_clip)
 
         except (ResolveNotRunning, ResolveOperationFailed):
             raise
@@ -402,6 +389,8 @@ def register(mcp: FastMCP) -> None:
         try:
             pool = _require_pool()
             timeline = pool.CreateEmptyTimeline(name)
+            # A newly created timeline becomes the current one
+            ResolveAPI.get_instance().invalidate_handles()
 
             if timeline is None:
                 raise ResolveOperationFailed(
@@ -454,6 +443,7 @@ def register(mcp: FastMCP) -> None:
                 )
 
             timeline = pool.CreateTimelineFromClips(name, clip_objs)
+            ResolveAPI.get_instance().invalidate_handles()
             if timeline is None:
                 raise ResolveOperationFailed(
                     "media_pool_create_timeline_from_clips",
@@ -498,6 +488,8 @@ def register(mcp: FastMCP) -> None:
                 )
 
             result = pool.DeleteClips(clip_objs)
+            # Deleting a clip also removes its uses from the timelines
+            invalidate_item_index()
             return bool(result)
 
         except (ResolveNotRunning, ResolveOperationFailed):
@@ -10,12 +10,12 @@ from __future__ import annotations
 
 from fastmcp import FastMCP
 
-from ..constants import ResolvePage
+from ..constants import RESOLVE_PAGES
 from ..exceptions import ResolveNotRunning, ResolveOperationFailed
 from ..resolve_api import ResolveAPI
 
-# Derive valid pages from the ResolvePage enum so they stay in sync automatically
-_VALID_PAGES = {p.value for p in ResolvePage}
+# Derive valid pages from the ResolvePage constants so they stay in sync automatically
+_VALID_PAGES = RESOLVE_PAGES
 
 
 def register(mcp: FastMCP) -> None:
@@ -60,6 +60,7 @@ def register(mcp: FastMCP) -> None:
             pm = api.project_manager
             # CreateProject() returns the new project object or None on failure
             new_project = pm.CreateProject(name)
+            api.invalidate_handles()
             if new_project is None:
                 raise ResolveOperationFailed(
                     "project_create",
@@ -95,6 +96,7 @@ def register(mcp: FastMCP) -> None:
             pm = api.project_manager
             # LoadProject() returns the project object or None on failure
             project = pm.LoadProject(name)
+            api.invalidate_handles()
             if project is None:
                 raise ResolveOperationFailed(
                     "project_open",
@@ -158,6 +160,7 @@ def register(mcp: FastMCP) -> None:
             pm = api.project_manager
             # CloseProject() saves and closes; returns True on success
             result: bool = pm.CloseProject(project)
+            api.invalidate_handles()
             if not result:
                 raise ResolveOperationFailed(
                     "project_close",
@@ -292,6 +295,8 @@ def register(mcp: FastMCP) -> None:
                 )
             # SetSetting() returns True on success
             result: bool = project.SetSetting(key, value)
+            # Drop the cached settings dict read by get_project_settings()
+            api.invalidate_handles()
             if not result:
                 raise ResolveOperationFailed(
                     "project_set_setting",
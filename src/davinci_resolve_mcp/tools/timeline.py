@@ -12,10 +12,15 @@ from __future__ import annotations
 
 from fastmcp import FastMCP
 
-from ..constants import ExportType, TimelineExportSubtype
+from ..constants import EXPORT_TYPES, TIMELINE_EXPORT_SUBTYPES
 from ..exceptions import ResolveNotRunning, ResolveOperationFailed
 from ..resolve_api import ResolveAPI
-from ._helpers import VALID_TRACK_TYPES
+from ._helpers import (
+    VALID_TRACK_TYPES,
+    VALID_TRACK_TYPES_STR,
+    invalidate_item_index,
+    paginate,
+)
 
 
 def register(mcp: FastMCP) -> None:
@@ -81,6 +86,7 @@ def register(mcp: FastMCP) -> None:
                 tl = project.GetTimelineByIndex(i)
                 if tl is not None and tl.GetName() == name:
                     result: bool = project.SetCurrentTimeline(tl)
+                    api.invalidate_handles()
                     if not result:
                         raise ResolveOperationFailed(
                             "timeline_set_current",
@@ -301,7 +307,7 @@ def register(mcp: FastMCP) -> None:
         if track_type not in VALID_TRACK_TYPES:
             raise ResolveOperationFailed(
                 "timeline_get_track_count",
-                f"Invalid track_type '{track_type}'. Must be one of: {', '.join(sorted(VALID_TRACK_TYPES))}",
+                f"Invalid track_type '{track_type}'. Must be one of: {VALID_TRACK_TYPES_STR}",
             )
         try:
             api = ResolveAPI.get_instance()
@@ -337,7 +343,7 @@ def register(mcp: FastMCP) -> None:
         if track_type not in VALID_TRACK_TYPES:
             raise ResolveOperationFailed(
                 "timeline_add_track",
-                f"Invalid track_type '{track_type}'. Must be one of: {', '.join(sorted(VALID_TRACK_TYPES))}",
+                f"Invalid track_type '{track_type}'. Must be one of: {VALID_TRACK_TYPES_STR}",
             )
         try:
             api = ResolveAPI.get_instance()
@@ -381,7 +387,7 @@ def register(mcp: FastMCP) -> None:
         if track_type not in VALID_TRACK_TYPES:
             raise ResolveOperationFailed(
                 "timeline_delete_track",
-                f"Invalid track_type '{track_type}'. Must be one of: {', '.join(sorted(VALID_TRACK_TYPES))}",
+                f"Invalid track_type '{track_type}'. Must be one of: {VALID_TRACK_TYPES_STR}",
             )
         if track_index < 1:
             raise ResolveOperationFailed("timeline_delete_track", "track_index must be >= 1 (1-based indexing).")
@@ -394,6 +400,7 @@ def register(mcp: FastMCP) -> None:
                 )
             # DeleteTrack() returns True on success
             result: bool = tl.DeleteTrack(track_type, track_index)
+            invalidate_item_index()
             if not result:
                 raise ResolveOperationFailed(
                     "timeline_delete_track",
@@ -423,7 +430,7 @@ def register(mcp: FastMCP) -> None:
         if track_type not in VALID_TRACK_TYPES:
             raise ResolveOperationFailed(
                 "timeline_get_track_name",
-                f"Invalid track_type '{track_type}'. Must be one of: {', '.join(sorted(VALID_TRACK_TYPES))}",
+                f"Invalid track_type '{track_type}'. Must be one of: {VALID_TRACK_TYPES_STR}",
             )
         if track_index < 1:
             raise ResolveOperationFailed("timeline_get_track_name", "track_index must be >= 1 (1-based indexing).")
@@ -462,7 +469,7 @@ def register(mcp: FastMCP) -> None:
         if track_type not in VALID_TRACK_TYPES:
             raise ResolveOperationFailed(
                 "timeline_set_track_name",
-                f"Invalid track_type '{track_type}'. Must be one of: {', '.join(sorted(VALID_TRACK_TYPES))}",
+                f"Invalid track_type '{track_type}'. Must be one of: {VALID_TRACK_TYPES_STR}",
             )
         if track_index < 1:
             raise ResolveOperationFailed("timeline_set_track_name", "track_index must be >= 1 (1-based indexing).")
@@ -511,7 +518,7 @@ def register(mcp: FastMCP) -> None:
         if track_type not in VALID_TRACK_TYPES:
             raise ResolveOperationFailed(
                 "timeline_set_track_enabled",
-                f"Invalid track_type '{track_type}'. Must be one of: {', '.join(sorted(VALID_TRACK_TYPES))}",
+                f"Invalid track_type '{track_type}'. Must be one of: {VALID_TRACK_TYPES_STR}",
             )
         if track_index < 1:
             raise ResolveOperationFailed("timeline_set_track_enabled", "track_index must be >= 1 (1-based indexing).")
@@ -559,7 +566,7 @@ def register(mcp: FastMCP) -> None:
         if track_type not in VALID_TRACK_TYPES:
             raise ResolveOperationFailed(
                 "timeline_set_track_locked",
-                f"Invalid track_type '{track_type}'. Must be one of: {', '.join(sorted(VALID_TRACK_TYPES))}",
+                f"Invalid track_type '{track_type}'. Must be one of: {VALID_TRACK_TYPES_STR}",
             )
         if track_index < 1:
             raise ResolveOperationFailed("timeline_set_track_locked", "track_index must be >= 1 (1-based indexing).")
@@ -613,7 +620,7 @@ def register(mcp: FastMCP) -> None:
         if track_type not in VALID_TRACK_TYPES:
             raise ResolveOperationFailed(
                 "timeline_get_items_in_track",
-                f"Invalid track_type '{track_type}'. Must be one of: {', '.join(sorted(VALID_TRACK_TYPES))}",
+                f"Invalid track_type '{track_type}'. Must be one of: {VALID_TRACK_TYPES_STR}",
             )
         if track_index < 1:
             raise ResolveOperationFailed("timeline_get_items_in_track", "track_index must be >= 1 (1-based indexing).")
@@ -631,35 +638,12 @@ def register(mcp: FastMCP) -> None:
 
             # GetItemListInTrack() returns all items on the specified track
             all_items = tl.GetItemListInTrack(track_type, track_index)
-            if not all_items:
-                return {
-                    "items": [],
-                    "total": 0,
-                    "offset": offset,
-                    "limit": limit,
-                    "has_more": False,
-                }
-
-            total = len(all_items)
-            # Apply pagination: slice the full list by offset and limit
-            page = all_items[offset : offset + limit]
-
-            items = []
-            for item in page:
-                items.append({
-                    "name": item.GetName(),
-                    "start": item.GetStart(),
-                    "end": item.GetEnd(),
-                    "duration": item.GetDuration(),
-                })
-
-            return {
-                "items": items,
-                "total": total,
-                "offset": offset,
-                "limit": limit,
-                "has_more": (offset + limit) < total,
-            }
+            return paginate(all_items, offset, limit, lambda item: {
+                "name": item.GetName(),
+                "start": item.GetStart(),
+                "end": item.GetEnd(),
+                "duration": item.GetDuration(),
+            })
         except (ResolveNotRunning, ResolveOperationFailed):
             raise
         except AttributeError as exc:
@@ -740,6 +724,7 @@ def register(mcp: FastMCP) -> None:
 
             # AppendToTimeline() accepts a list of MediaPoolItem objects
             result = pool.AppendToTimeline(clip_objs)
+            invalidate_item_index()
             if not result:
                 raise ResolveOperationFailed(
                     "timeline_append_clips",
@@ -777,7 +762,7 @@ def register(mcp: FastMCP) -> None:
         if track_type not in VALID_TRACK_TYPES:
             raise ResolveOperationFailed(
                 "timeline_delete_clips",
-                f"Invalid track_type '{track_type}'. Must be one of: {', '.join(sorted(VALID_TRACK_TYPES))}",
+                f"Invalid track_type '{track_type}'. Must be one of: {VALID_TRACK_TYPES_STR}",
             )
         if track_index < 1:
             raise ResolveOperationFailed("timeline_delete_clips", "track_index must be >= 1 (1-based indexing).")
@@ -812,6 +797,7 @@ def register(mcp: FastMCP) -> None:
 
             # DeleteClips() takes a list of TimelineItem objects
             result: bool = tl.DeleteClips(items_to_delete)
+            invalidate_item_index()
             if not result:
                 raise ResolveOperationFailed(
                     "timeline_delete_clips",
@@ -851,6 +837,7 @@ def register(mcp: FastMCP) -> None:
 
             # DuplicateTimeline() returns a new Timeline object or None
             new_tl = tl.DuplicateTimeline()
+            api.invalidate_handles()
             if new_tl is None:
                 return None
 
@@ -997,8 +984,8 @@ def register(mcp: FastMCP) -> None:
     # Timeline export (AAF, EDL, FCPXML, etc.)
     # ------------------------------------------------------------------
 
-    _VALID_EXPORT_TYPES = {t.value for t in ExportType}
-    _VALID_EXPORT_SUBTYPES = {t.value for t in TimelineExportSubtype}
+    _VALID_EXPORT_TYPES = EXPORT_TYPES
+    _VALID_EXPORT_SUBTYPES = TIMELINE_EXPORT_SUBTYPES
 
     @mcp.tool()
     def timeline_export(
@@ -1084,7 +1071,7 @@ def register(mcp: FastMCP) -> None:
             raise ResolveOperationFailed(
                 "timeline_create_compound_clip",
                 f"Invalid track_type '{track_type}'. "
-                f"Must be one of: {', '.join(sorted(VALID_TRACK_TYPES))}",
+                f"Must be one of: {VALID_TRACK_TYPES_STR}",
             )
         if track_index < 1:
             raise ResolveOperationFailed(
@@ -1124,6 +1111,7 @@ def register(mcp: FastMCP) -> None:
                 clip_info["name"] = clip_name
 
             result = tl.CreateCompoundClip(items_to_merge, clip_info)
+            invalidate_item_index()
             if not result:
                 raise ResolveOperationFailed(
                     "timeline_create_compound_clip",
@@ -1165,7 +1153,7 @@ def register(mcp: FastMCP) -> None:
             raise ResolveOperationFailed(
                 "timeline_create_fusion_clip",
                 f"Invalid track_type '{track_type}'. "
-                f"Must be one of: {', '.join(sorted(VALID_TRACK_TYPES))}",
+                f"Must be one of: {VALID_TRACK_TYPES_STR}",
             )
         if track_index < 1:
             raise ResolveOperationFailed(
@@ -1200,6 +1188,7 @@ def register(mcp: FastMCP) -> None:
                 )
 
             result = tl.CreateFusionClip(items_to_fuse)
+            invalidate_item_index()
             if not result:
                 raise ResolveOperationFailed(
                     "timeline_create_fusion_clip",
@@ -1242,6 +1231,7 @@ def register(mcp: FastMCP) -> None:
 
             # DetectSceneCuts() returns a list of frame numbers
             result = tl.DetectSceneCuts()
+            invalidate_item_index()
             return result if result else []
         except (ResolveNotRunning, ResolveOperationFailed):
             raise
@@ -1276,6 +1266,7 @@ def register(mcp: FastMCP) -> None:
 
             # CreateSubtitlesFromAudio() returns True on success
             result: bool = tl.CreateSubtitlesFromAudio()
+            invalidate_item_index()
             if not result:
                 raise ResolveOperationFailed(
                     "timeline_create_subtitles_from_audio",
@@ -12,7 +12,7 @@ from typing import Any
 from fastmcp import FastMCP
 
 from ..exceptions import ResolveNotRunning, ResolveOperationFailed
-from ._helpers import find_item
+from ._helpers import find_item, invalidate_grade_cache
 
 
 # ------------------------------------------------------------------
@@ -1116,6 +1116,8 @@ def register(mcp: FastMCP) -> None:
         try:
             item = find_item(item_name, track_type, track_index)
             result: bool = item.AddNode()
+            # The node count read by the color tools is cached
+            invalidate_grade_cache(item_name, track_type, track_index)
             if not result:
                 raise ResolveOperationFailed(
                     "item_add_node",
@@ -25,6 +25,15 @@ import pytest_asyncio
 from fastmcp import Client, FastMCP
 
 from davinci_resolve_mcp.resolve_api import ResolveAPI
+from davinci_resolve_mcp.tools._helpers import (
+    _grade_cache,
+    _project_keys,
+    _track_name_index,
+    _unsupported,
+)
+from davinci_resolve_mcp.tools.color import _group_cache
+from davinci_resolve_mcp.tools.fairlight import _preset_cache
+from davinci_resolve_mcp.tools.fusion import _comp_cache
 
 
 # ---------------------------------------------------------------------------
@@ -593,13 +602,22 @@ class MockProject:
     def GetName(self) -> str:
         return "Test Project"
 
+    def GetUniqueId(self) -> str:
+        return "project-001"
+
     def SaveProject(self) -> bool:
         return True
 
     def ExportProject(self, path: str, with_stills: bool = True) -> bool:
         return True
 
-    def GetSetting(self, key: str) -> str:
+    def GetSetting(self, key: str | None = None) -> Any:
+        # With no key, Resolve returns every setting as a dict
+        if key is None:
+            return {
+                k: self.GetSetting(k)
+                for k in ("timelineResolutionWidth", "timelineResolutionHeight", "timelineFrameRate")
+            }
         # Return realistic values for common settings
         if "Width" in key:
             return "1920"
@@ -837,8 +855,15 @@ def mock_resolve(monkeypatch: pytest.MonkeyPatch) -> MockResolve:
 
     Returns the ``MockResolve`` instance for direct assertions in tests.
     """
-    # Reset any previous singleton state
+    # Reset any previous singleton state and cached tool results
     ResolveAPI.reset()
+    _grade_cache.clear()
+    _group_cache.clear()
+    _preset_cache.clear()
+    _comp_cache.clear()
+    _unsupported.clear()
+    _track_name_index.clear()
+    _project_keys.clear()
 
     # Build a pre-configured ResolveAPI instance with mock references
     mock = MockResolve()
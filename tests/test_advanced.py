@@ -6,7 +6,7 @@ from __future__ import annotations
 import pytest
 from fastmcp import Client
 
-from conftest import extract_data
+from conftest import MockTimelineItem, extract_data
 
 
 # ===================================================================
@@ -426,6 +426,25 @@ async def test_item_add_node(mcp_server: Client):
     assert extract_data(result) is True
 
 
+@pytest.mark.asyncio
+async def test_item_add_node_refreshes_cached_node_count(
+    mcp_server: Client, monkeypatch: pytest.MonkeyPatch
+):
+    """color_get_num_nodes sees the node item_add_node just added."""
+    nodes = {"count": 3}
+
+    def add_node(self) -> bool:
+        nodes["count"] += 1
+        return True
+
+    monkeypatch.setattr(MockTimelineItem, "GetNumNodes", lambda self: nodes["count"])
+    monkeypatch.setattr(MockTimelineItem, "AddNode", add_node)
+    args = {"item_name": "Clip A"}
+    assert extract_data(await mcp_server.call_tool("color_get_num_nodes", args)) == 3
+    await mcp_server.call_tool("item_add_node", args)
+    assert extract_data(await mcp_server.call_tool("color_get_num_nodes", args)) == 4
+
+
 # ===================================================================
 # Node Labels (color.py)
 # ===================================================================
@@ -452,6 +471,45 @@ async def test_color_set_node_label(mcp_server: Client):
     assert extract_data(result) is True
 
 
+@pytest.mark.asyncio
+async def test_color_node_label_unsupported(mcp_server: Client, monkeypatch: pytest.MonkeyPatch):
+    """A missing GetNodeLabel is reported as unsupported, not as a lost connection."""
+    probes: list[int] = []
+
+    def missing(self, index: int) -> str:
+        probes.append(index)
+        raise AttributeError("GetNodeLabel")
+
+    monkeypatch.setattr(MockTimelineItem, "GetNodeLabel", missing)
+    for _ in range(2):
+        with pytest.raises(Exception, match="not available in this Resolve version"):
+            await mcp_server.call_tool("color_get_node_label", {
+                "item_name": "Clip A",
+                "node_index": 1,
+            })
+    assert probes == [1]
+
+
+@pytest.mark.asyncio
+async def test_color_set_node_labels(mcp_server: Client):
+    """color_set_node_labels sets several labels with one item lookup."""
+    result = await mcp_server.call_tool("color_set_node_labels", {
+        "item_name": "Clip A",
+        "labels": {"1": "Balance", "2": "Look"},
+    })
+    assert {int(k): v for k, v in extract_data(result).items()} == {1: True, 2: True}
+
+
+@pytest.mark.asyncio
+async def test_color_set_node_labels_index_validation(mcp_server: Client):
+    """color_set_node_labels rejects any node index < 1 before touching Resolve."""
+    with pytest.raises(Exception, match="must be >= 1"):
+        await mcp_server.call_tool("color_set_node_labels", {
+            "item_name": "Clip A",
+            "labels": {"0": "Bad", "1": "Good"},
+        })
+
+
 @pytest.mark.asyncio
 async def test_color_node_label_index_validation(mcp_server: Client):
     """color_get_node_label rejects node_index < 1."""
@@ -2,9 +2,9 @@
 
 Covers all 22 tools registered by ``davinci_resolve_mcp.tools.color``:
 node info, LUT operations, CDL get/set, node enable, DRX grade application,
-grade reset, grade version management (add, count, list, set current, get
-current, delete, rename, load), and color group operations (list, create,
-delete, assign, remove).
+grade summary, grade reset, grade version management (add, count, list, set
+current, get current, delete, rename, load), color group operations (list,
+create, delete, assign, remove), and the read-only result cache.
 """
 
 from __future__ import annotations
@@ -12,7 +12,8 @@ from __future__ import annotations
 import pytest
 from fastmcp import Client
 
-from conftest import extract_data
+from conftest import MockProject, MockTimelineItem, extract_data
+from davinci_resolve_mcp import concurrency
 
 
 # ---------------------------------------------------------------------------
@@ -60,6 +61,45 @@ async def test_set_lut(mcp_server: Client) -> None:
     assert result.data is True
 
 
+@pytest.mark.asyncio
+async def test_set_lut_bulk(mcp_server: Client) -> None:
+    """color_set_lut_bulk reports the outcome for every requested item."""
+    result = await mcp_server.call_tool(
+        "color_set_lut_bulk",
+        {"item_names": ["Clip A", "Clip B"], "lut_path": "/luts/show.cube"},
+    )
+    assert extract_data(result) == {"Clip A": True, "Clip B": True}
+
+
+@pytest.mark.asyncio
+async def test_set_lut_bulk_reports_partial_failure(
+    mcp_server: Client, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A SetLUT error on one clip is reported as False for that clip only."""
+
+    def set_lut(self, node_index: int, path: str) -> bool:
+        if self._name == "Clip B":
+            raise RuntimeError("LUT rejected")
+        return True
+
+    monkeypatch.setattr(MockTimelineItem, "SetLUT", set_lut)
+    result = await mcp_server.call_tool(
+        "color_set_lut_bulk",
+        {"item_names": ["Clip A", "Clip B"], "lut_path": "/luts/show.cube"},
+    )
+    assert extract_data(result) == {"Clip A": True, "Clip B": False}
+
+
+@pytest.mark.asyncio
+async def test_set_lut_bulk_unknown_item(mcp_server: Client) -> None:
+    """color_set_lut_bulk fails before applying anything if a name is unknown."""
+    with pytest.raises(Exception):
+        await mcp_server.call_tool(
+            "color_set_lut_bulk",
+            {"item_names": ["Clip A", "Missing"], "lut_path": "/luts/show.cube"},
+        )
+
+
 @pytest.mark.asyncio
 async def test_get_lut(mcp_server: Client) -> None:
     """color_get_lut returns the LUT path assigned to a node."""
@@ -111,6 +151,20 @@ async def test_get_cdl(mcp_server: Client) -> None:
     assert data["Saturation"] == 1.0
 
 
+@pytest.mark.asyncio
+async def test_get_summary(mcp_server: Client) -> None:
+    """color_get_summary bundles node count, CDL, current version and LUT."""
+    result = await mcp_server.call_tool(
+        "color_get_summary",
+        {"item_name": "Clip A", "track_type": "video", "track_index": 1},
+    )
+    data = extract_data(result)
+    assert data["num_nodes"] == 3
+    assert data["cdl"]["Saturation"] == 1.0
+    assert data["current_version"] == "Default"
+    assert data["lut"] == "/path/to/lut.cube"
+
+
 @pytest.mark.asyncio
 async def test_set_cdl(mcp_server: Client) -> None:
     """color_set_cdl applies CDL values and returns True."""
@@ -188,6 +242,25 @@ async def test_set_node_enabled_enable(mcp_server: Client) -> None:
     assert result.data is True
 
 
+@pytest.mark.asyncio
+async def test_set_node_enabled_unsupported_is_remembered(
+    mcp_server: Client, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A build without SetNodeEnabled is probed once, then short-circuited."""
+    probes: list[int] = []
+
+    def missing(self, node_index: int, enabled: bool) -> bool:
+        probes.append(node_index)
+        raise AttributeError("SetNodeEnabled")
+
+    monkeypatch.setattr(MockTimelineItem, "SetNodeEnabled", missing)
+    args = {"item_name": "Clip A", "node_index": 1, "enabled": False}
+    for _ in range(2):
+        result = await mcp_server.call_tool("color_set_node_enabled", args)
+        assert result.data is False
+    assert probes == [1]
+
+
 # ---------------------------------------------------------------------------
 # Grade application from DRX
 # ---------------------------------------------------------------------------
@@ -224,6 +297,23 @@ async def test_apply_drx_multiple_items(mcp_server: Client) -> None:
     assert result.data is True
 
 
+def test_lookup_workers_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The track-scan pool size comes from the env var; unset means serial."""
+    monkeypatch.setenv(concurrency._LOOKUP_WORKERS_ENV, "4")
+    assert concurrency._lookup_workers() == 4
+    monkeypatch.delenv(concurrency._LOOKUP_WORKERS_ENV)
+    assert concurrency._lookup_workers() == 1
+
+
+def test_lookup_workers_env_garbage_falls_back_to_serial(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    """A non-integer worker count is logged and treated as serial."""
+    monkeypatch.setenv(concurrency._LOOKUP_WORKERS_ENV, "many")
+    assert concurrency._lookup_workers() == 1
+    assert "many" in caplog.text
+
+
 @pytest.mark.asyncio
 async def test_apply_drx_invalid_grade_mode(mcp_server: Client) -> None:
     """color_apply_drx raises for an invalid grade_mode value."""
@@ -240,6 +330,22 @@ async def test_apply_drx_invalid_grade_mode(mcp_server: Client) -> None:
         )
 
 
+@pytest.mark.asyncio
+async def test_apply_drx_reports_missing_items(mcp_server: Client) -> None:
+    """color_apply_drx names every item it could not find on the track."""
+    with pytest.raises(Exception, match="'Clip X', 'Clip Y'"):
+        await mcp_server.call_tool(
+            "color_apply_drx",
+            {
+                "drx_path": "/grades/look.drx",
+                "grade_mode": 1,
+                "item_names": ["Clip A", "Clip X", "Clip Y"],
+                "track_type": "video",
+                "track_index": 1,
+            },
+        )
+
+
 # ---------------------------------------------------------------------------
 # Grade reset (destructiveHint)
 # ---------------------------------------------------------------------------
@@ -434,6 +540,39 @@ async def test_remove_from_group(mcp_server: Client) -> None:
     assert result.data is True
 
 
+@pytest.mark.asyncio
+async def test_assign_to_group_bulk(mcp_server: Client) -> None:
+    """color_assign_to_group_bulk reports the outcome for every item."""
+    result = await mcp_server.call_tool(
+        "color_assign_to_group_bulk",
+        {"item_names": ["Clip A", "Clip B"], "group_id": "group-001"},
+    )
+    assert extract_data(result) == {"Clip A": True, "Clip B": True}
+
+
+@pytest.mark.asyncio
+async def test_remove_from_group_bulk(mcp_server: Client) -> None:
+    """color_remove_from_group_bulk reports the outcome for every item."""
+    result = await mcp_server.call_tool(
+        "color_remove_from_group_bulk",
+        {"item_names": ["Clip B"], "group_id": "group-001"},
+    )
+    assert extract_data(result) == {"Clip B": True}
+
+
+@pytest.mark.asyncio
+async def test_assign_to_groups(mcp_server: Client) -> None:
+    """color_assign_to_groups reports each (item, group) outcome."""
+    result = await mcp_server.call_tool(
+        "color_assign_to_groups",
+        {"assignments": {"Clip A": ["group-001", "group-002"], "Clip B": ["group-001"]}},
+    )
+    assert extract_data(result) == {
+        "Clip A": {"group-001": True, "group-002": True},
+        "Clip B": {"group-001": True},
+    }
+
+
 # ---------------------------------------------------------------------------
 # Track type validation (shared across item-based tools)
 # ---------------------------------------------------------------------------
@@ -446,3 +585,112 @@ async def test_invalid_track_type(mcp_server: Client) -> None:
             "color_get_num_nodes",
             {"item_name": "Clip A", "track_type": "invalid", "track_index": 1},
         )
+
+
+# ---------------------------------------------------------------------------
+# Read cache
+# ---------------------------------------------------------------------------
+
+_LUT_ARGS = {"item_name": "Clip A", "node_index": 1, "track_type": "video", "track_index": 1}
+
+
+@pytest.fixture()
+def lut_reads(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    """Count GetLUT() calls that actually reach the mock Resolve."""
+    calls: list[int] = []
+
+    def get_lut(self, node_index: int) -> str:
+        calls.append(node_index)
+        return "/path/to/lut.cube"
+
+    monkeypatch.setattr(MockTimelineItem, "GetLUT", get_lut)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_read_tools_are_cached(mcp_server: Client, lut_reads: list[int]) -> None:
+    """Repeated color_get_lut calls are served from the cache."""
+    for _ in range(3):
+        result = await mcp_server.call_tool("color_get_lut", _LUT_ARGS)
+        assert result.data == "/path/to/lut.cube"
+    assert lut_reads == [1]
+
+
+@pytest.mark.asyncio
+async def test_mutating_tool_invalidates_cache(mcp_server: Client, lut_reads: list[int]) -> None:
+    """color_set_lut drops the cached reads for the item it changed."""
+    await mcp_server.call_tool("color_get_lut", _LUT_ARGS)
+    await mcp_server.call_tool("color_set_lut", {**_LUT_ARGS, "lut_path": "/luts/new.cube"})
+    await mcp_server.call_tool("color_get_lut", _LUT_ARGS)
+    assert lut_reads == [1, 1]
+
+
+@pytest.mark.asyncio
+async def test_cache_clear(mcp_server: Client, lut_reads: list[int]) -> None:
+    """color_cache_clear empties the cache and reports how much it dropped."""
+    await mcp_server.call_tool("color_get_lut", _LUT_ARGS)
+    result = await mcp_server.call_tool("color_cache_clear", {})
+    assert result.data >= 1
+    await mcp_server.call_tool("color_get_lut", _LUT_ARGS)
+    assert lut_reads == [1, 1]
+
+
+@pytest.mark.asyncio
+async def test_version_count_shares_version_list(
+    mcp_server: Client, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """color_get_version_count reuses the list cached by color_get_versions."""
+    calls: list[int] = []
+
+    def get_version_names(self, version_type: int) -> list[str]:
+        calls.append(version_type)
+        return ["Version 1", "Default"]
+
+    monkeypatch.setattr(MockTimelineItem, "GetVersionNameList", get_version_names)
+    args = {"item_name": "Clip A", "version_type": 0}
+    await mcp_server.call_tool("color_get_versions", args)
+    result = await mcp_server.call_tool("color_get_version_count", args)
+    assert result.data == 2
+    assert calls == [0]
+
+
+@pytest.mark.asyncio
+async def test_group_list_cached_until_create(
+    mcp_server: Client, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The group list is cached per project and dropped by color_create_group."""
+    calls: list[None] = []
+
+    def get_groups(self) -> list[dict]:
+        calls.append(None)
+        return [{"name": "Group 1", "id": "group-001"}]
+
+    monkeypatch.setattr(MockProject, "GetColorGroupsList", get_groups)
+    await mcp_server.call_tool("color_get_group_list", {})
+    await mcp_server.call_tool("color_get_group_list", {})
+    assert len(calls) == 1
+    await mcp_server.call_tool("color_create_group", {"group_name": "Day Ext"})
+    await mcp_server.call_tool("color_get_group_list", {})
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_group_list_hit_makes_no_identity_call(
+    mcp_server: Client, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The project's cache key is read once per handle, not on every hit."""
+    calls: list[str] = []
+
+    def get_unique_id(self) -> str:
+        calls.append("GetUniqueId")
+        return "project-001"
+
+    def get_name(self) -> str:
+        calls.append("GetName")
+        return "Test Project"
+
+    monkeypatch.setattr(MockProject, "GetUniqueId", get_unique_id)
+    monkeypatch.setattr(MockProject, "GetName", get_name)
+    for _ in range(3):
+        await mcp_server.call_tool("color_get_group_list", {})
+    assert calls == ["GetUniqueId"]
@@ -1,7 +1,7 @@
 """Tests for Fairlight audio tools.
 
-Covers all 3 tools registered by ``davinci_resolve_mcp.tools.fairlight``:
-insert audio, list presets, and apply preset.
+Covers all 4 tools registered by ``davinci_resolve_mcp.tools.fairlight``:
+insert audio (single and batch), list presets, and apply preset.
 """
 
 from __future__ import annotations
@@ -9,7 +9,7 @@ from __future__ import annotations
 import pytest
 from fastmcp import Client
 
-from conftest import extract_data
+from conftest import MockMediaPool, MockProject, extract_data
 
 
 # ---------------------------------------------------------------------------
@@ -36,6 +36,37 @@ async def test_insert_audio_default_track(mcp_server: Client) -> None:
     assert result.data is True
 
 
+@pytest.mark.asyncio
+async def test_insert_audio_batch(mcp_server: Client) -> None:
+    """fairlight_insert_audio_batch imports and appends files in one pass."""
+    result = await mcp_server.call_tool(
+        "fairlight_insert_audio_batch",
+        {"file_paths": ["/audio/voiceover.wav"], "track_index": 2},
+    )
+    assert extract_data(result) == {"requested": 1, "imported": 1}
+
+
+@pytest.mark.asyncio
+async def test_insert_audio_plain_append_is_remembered(
+    mcp_server: Client, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Once the clip-info form is rejected, later inserts append bare items directly."""
+    calls: list[str] = []
+
+    def append(self, clips: list) -> list:
+        if isinstance(clips[0], dict):
+            calls.append("clip_info")
+            raise TypeError("clip info not supported")
+        calls.append("items")
+        return clips
+
+    monkeypatch.setattr(MockMediaPool, "AppendToTimeline", append)
+    for _ in range(2):
+        result = await mcp_server.call_tool("fairlight_insert_audio", {"file_path": "/audio/a.wav"})
+        assert result.data is True
+    assert calls == ["clip_info", "items", "items"]
+
+
 # ---------------------------------------------------------------------------
 # Presets
 # ---------------------------------------------------------------------------
@@ -49,6 +80,24 @@ async def test_get_presets(mcp_server: Client) -> None:
     assert data == ["Dialogue", "Music", "SFX"]
 
 
+@pytest.mark.asyncio
+async def test_get_presets_cached(
+    mcp_server: Client, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Repeated fairlight_get_presets calls reuse the cached list."""
+    calls: list[None] = []
+
+    def get_presets(self) -> list[str]:
+        calls.append(None)
+        return ["Dialogue"]
+
+    monkeypatch.setattr(MockProject, "GetFairlightPresetList", get_presets)
+    for _ in range(3):
+        result = await mcp_server.call_tool("fairlight_get_presets", {})
+        assert extract_data(result) == ["Dialogue"]
+    assert len(calls) == 1
+
+
 @pytest.mark.asyncio
 async def test_apply_preset(mcp_server: Client) -> None:
     """fairlight_apply_preset applies a preset and returns True."""
@@ -67,3 +116,41 @@ async def test_apply_preset_default_track(mcp_server: Client) -> None:
         {"preset_name": "Music"},
     )
     assert result.data is True
+
+
+@pytest.mark.asyncio
+async def test_apply_preset_unsupported_is_remembered(
+    mcp_server: Client, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A build without ApplyFairlightPreset is probed once, then refused directly."""
+    probes: list[str] = []
+
+    def missing(self, name: str, *args) -> bool:
+        probes.append(name)
+        raise AttributeError("ApplyFairlightPreset")
+
+    monkeypatch.setattr(MockProject, "ApplyFairlightPreset", missing)
+    for _ in range(2):
+        with pytest.raises(Exception, match="not available"):
+            await mcp_server.call_tool("fairlight_apply_preset", {"preset_name": "Dialogue"})
+    assert probes == ["Dialogue"]
+
+
+@pytest.mark.asyncio
+async def test_apply_preset_single_arg_form_is_remembered(
+    mcp_server: Client, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """After a TypeError from the per-track form, later calls skip straight to the global form."""
+    calls: list[tuple] = []
+
+    def single_arg_only(self, name: str, *args) -> bool:
+        calls.append((name, *args))
+        if args:
+            raise TypeError("ApplyFairlightPreset() takes 1 argument")
+        return True
+
+    monkeypatch.setattr(MockProject, "ApplyFairlightPreset", single_arg_only)
+    for _ in range(2):
+        result = await mcp_server.call_tool("fairlight_apply_preset", {"preset_name": "Music"})
+        assert result.data is True
+    assert calls == [("Music", 1), ("Music",), ("Music",)]
@@ -1,17 +1,20 @@
 """Tests for Fusion composition tools.
 
-Covers all 11 tools registered by ``davinci_resolve_mcp.tools.fusion``:
-comp count, comp names, comp info, add comp, import comp, export comp,
-delete comp (destructiveHint), rename comp, insert generator, insert title,
-and tool list within a composition.
+Covers all 14 tools registered by ``davinci_resolve_mcp.tools.fusion``:
+comp count, comp names, comp info, describe item, add comp, import comp,
+export comp, delete comp (destructiveHint), rename comp, insert
+generator(s), insert title(s), and tool list within a composition.
 """
 
 from __future__ import annotations
 
+from pathlib import Path
+
 import pytest
 from fastmcp import Client
 
-from conftest import extract_data
+from conftest import MockFusionComp, MockMediaPool, MockTimelineItem, extract_data
+from davinci_resolve_mcp.tools import fusion
 
 
 # ---------------------------------------------------------------------------
@@ -70,6 +73,47 @@ async def test_get_comp_item_not_found(mcp_server: Client) -> None:
         )
 
 
+@pytest.mark.asyncio
+async def test_describe_item(mcp_server: Client) -> None:
+    """fusion_describe_item returns count, names and optional tool counts."""
+    result = await mcp_server.call_tool(
+        "fusion_describe_item", {"item_name": "Clip A"}
+    )
+    assert extract_data(result) == {"count": 1, "names": ["Comp 1"]}
+    result = await mcp_server.call_tool(
+        "fusion_describe_item",
+        {"item_name": "Clip A", "include_tool_counts": True},
+    )
+    assert extract_data(result) == {
+        "count": 1,
+        "names": ["Comp 1"],
+        "tool_counts": {"Comp 1": 1},
+    }
+
+
+@pytest.mark.asyncio
+async def test_describe_item_looks_up_item_once(
+    mcp_server: Client, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Tool counts reuse the item fusion_describe_item already found."""
+    lookups: list[str] = []
+    original = fusion.find_item
+
+    def counting_find_item(*args: object) -> object:
+        lookups.append(str(args[0]))
+        return original(*args)
+
+    monkeypatch.setattr(fusion, "find_item", counting_find_item)
+    monkeypatch.setattr(
+        MockTimelineItem, "GetFusionCompNameList", lambda self: ["Comp 1", "Comp 2"]
+    )
+    await mcp_server.call_tool(
+        "fusion_describe_item",
+        {"item_name": "Clip A", "include_tool_counts": True},
+    )
+    assert lookups == ["Clip A"]
+
+
 # ---------------------------------------------------------------------------
 # Composition CRUD
 # ---------------------------------------------------------------------------
@@ -83,13 +127,15 @@ async def test_add_comp(mcp_server: Client) -> None:
 
 
 @pytest.mark.asyncio
-async def test_import_comp(mcp_server: Client) -> None:
+async def test_import_comp(mcp_server: Client, tmp_path: Path) -> None:
     """fusion_import_comp imports a .comp file onto a timeline item."""
+    comp_path = tmp_path / "title_template.comp"
+    comp_path.write_text("Composition {}")
     result = await mcp_server.call_tool(
         "fusion_import_comp",
         {
             "item_name": "Clip A",
-            "comp_path": "/comps/title_template.comp",
+            "comp_path": str(comp_path),
             "track_type": "video",
             "track_index": 1,
         },
@@ -98,14 +144,14 @@ async def test_import_comp(mcp_server: Client) -> None:
 
 
 @pytest.mark.asyncio
-async def test_export_comp(mcp_server: Client) -> None:
+async def test_export_comp(mcp_server: Client, tmp_path: Path) -> None:
     """fusion_export_comp exports a composition to a .comp file."""
     result = await mcp_server.call_tool(
         "fusion_export_comp",
         {
             "item_name": "Clip A",
             "comp_name": "Comp 1",
-            "export_path": "/tmp/exported.comp",
+            "export_path": str(tmp_path / "exported.comp"),
             "track_type": "video",
             "track_index": 1,
         },
@@ -113,6 +159,27 @@ async def test_export_comp(mcp_server: Client) -> None:
     assert result.data is True
 
 
+@pytest.mark.asyncio
+async def test_import_export_comp_reject_bad_paths(
+    mcp_server: Client, tmp_path: Path
+) -> None:
+    """A missing import file or export directory fails before calling Resolve."""
+    with pytest.raises(Exception, match="does not exist"):
+        await mcp_server.call_tool(
+            "fusion_import_comp",
+            {"item_name": "Clip A", "comp_path": str(tmp_path / "missing.comp")},
+        )
+    with pytest.raises(Exception, match="does not exist or is not writable"):
+        await mcp_server.call_tool(
+            "fusion_export_comp",
+            {
+                "item_name": "Clip A",
+                "comp_name": "Comp 1",
+                "export_path": str(tmp_path / "missing" / "out.comp"),
+            },
+        )
+
+
 @pytest.mark.asyncio
 async def test_delete_comp(mcp_server: Client) -> None:
     """fusion_delete_comp deletes a composition by name (destructiveHint)."""
@@ -168,6 +235,36 @@ async def test_insert_title(mcp_server: Client) -> None:
     assert result.data is True
 
 
+@pytest.mark.asyncio
+async def test_insert_generators_and_titles_batched(
+    mcp_server: Client, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The batch insert tools append every name with one AppendToTimeline call."""
+    calls: list[list[dict]] = []
+
+    def append(self, clips: list) -> list:
+        calls.append(clips)
+        return [object() for _ in clips]
+
+    monkeypatch.setattr(MockMediaPool, "AppendToTimeline", append)
+    result = await mcp_server.call_tool(
+        "fusion_insert_generators",
+        {"generator_names": ["Fusion Composition", "Solid Color"]},
+    )
+    assert extract_data(result) == {"requested": 2, "inserted": 2}
+    result = await mcp_server.call_tool(
+        "fusion_insert_titles", {"title_names": ["Text+"]}
+    )
+    assert extract_data(result) == {"requested": 1, "inserted": 1}
+    assert calls == [
+        [
+            {"mediaType": "generator", "generatorType": "Fusion Composition"},
+            {"mediaType": "generator", "generatorType": "Solid Color"},
+        ],
+        [{"mediaType": "title", "generatorType": "Text+"}],
+    ]
+
+
 # ---------------------------------------------------------------------------
 # Tool listing within a composition
 # ---------------------------------------------------------------------------
@@ -190,6 +287,55 @@ async def test_get_tool_list(mcp_server: Client) -> None:
     assert data == ["Background1"]
 
 
+@pytest.mark.asyncio
+async def test_get_tool_list_keeps_order(
+    mcp_server: Client, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Tool names come back in comp order, with str() for tools lacking GetAttrs."""
+
+    class Named:
+        def __init__(self, name: str) -> None:
+            self.name = name
+
+        def GetAttrs(self, key: str) -> str:
+            return self.name
+
+    tools = {str(i): Named(f"Tool{i}") for i in range(5)}
+    tools["bare"] = "BareTool"
+    monkeypatch.setattr(MockFusionComp, "GetToolList", lambda self: tools)
+    result = await mcp_server.call_tool(
+        "fusion_get_tool_list", {"item_name": "Clip A", "comp_name": "Comp 1"}
+    )
+    assert extract_data(result) == [f"Tool{i}" for i in range(5)] + ["BareTool"]
+
+
+@pytest.mark.asyncio
+async def test_comp_handle_is_cached_until_modified(
+    mcp_server: Client, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """fusion_get_comp and fusion_get_tool_list share one GetFusionCompByName call."""
+    lookups: list[str] = []
+    original = MockTimelineItem.GetFusionCompByName
+
+    def get_comp(self, name: str) -> MockFusionComp:
+        lookups.append(name)
+        return original(self, name)
+
+    monkeypatch.setattr(MockTimelineItem, "GetFusionCompByName", get_comp)
+    args = {"item_name": "Clip A", "comp_name": "Comp 1"}
+    await mcp_server.call_tool("fusion_get_comp", args)
+    await mcp_server.call_tool("fusion_get_tool_list", args)
+    assert lookups == ["Comp 1"]
+
+    # Renaming a comp on the item drops its cached handles
+    await mcp_server.call_tool(
+        "fusion_rename_comp",
+        {"item_name": "Clip A", "old_name": "Comp 1", "new_name": "Comp 2"},
+    )
+    await mcp_server.call_tool("fusion_get_tool_list", args)
+    assert lookups == ["Comp 1", "Comp 1"]
+
+
 # ---------------------------------------------------------------------------
 # Track type validation
 # ---------------------------------------------------------------------------
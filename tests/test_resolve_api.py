@@ -10,7 +10,9 @@ from __future__ import annotations
 from unittest.mock import patch
 
 import pytest
+from conftest import MockProject
 
+from davinci_resolve_mcp.exceptions import ResolveNotRunning
 from davinci_resolve_mcp.resolve_api import ResolveAPI, _get_modules_path
 
 
@@ -43,6 +45,17 @@ class TestSingleton:
         # They should be different objects since reset() cleared the singleton
         assert first is not second
 
+    def test_connect_without_resolve_raises_not_running(self) -> None:
+        """scriptapp() returning None raises a fresh ResolveNotRunning each time."""
+        api = ResolveAPI.get_instance()
+        api._script_module = type("FakeModule", (), {"scriptapp": staticmethod(lambda _: None)})()
+        raised = []
+        for _ in range(2):
+            with pytest.raises(ResolveNotRunning, match="not running") as info:
+                api._connect()
+            raised.append(info.value)
+        assert raised[0] is not raised[1]
+
 
 # ---------------------------------------------------------------------------
 # Platform detection
@@ -73,3 +86,77 @@ class TestPlatformDetection:
             path = _get_modules_path()
             assert path.startswith("/opt/resolve/")
             assert path.endswith("Modules/")
+
+
+# ---------------------------------------------------------------------------
+# Derived handle caching
+# ---------------------------------------------------------------------------
+
+class TestHandleCache:
+    """Verify derived handles are reused within a health-check window."""
+
+    def test_project_cached_within_ttl(self, mock_resolve) -> None:
+        """Repeated api.project reads return the same object."""
+        api = ResolveAPI.get_instance()
+        first = api.project
+        assert api.project is first
+        assert api.project_manager is api.project_manager
+
+    def test_invalidate_handles_refetches(self, mock_resolve) -> None:
+        """invalidate_handles() forces the next access to query Resolve again."""
+        api = ResolveAPI.get_instance()
+        first = api.project
+        api.invalidate_handles()
+        # MockProjectManager returns a fresh MockProject on every call
+        assert api.project is not first
+
+    def test_health_check_clears_handles(self, mock_resolve) -> None:
+        """An expired health-check window drops the cached handles."""
+        api = ResolveAPI.get_instance()
+        first = api.project
+        api._last_health_check = 0.0  # force the next access to re-check
+        assert api.project is not first
+
+    def test_timeline_and_pool_cached(self, mock_resolve) -> None:
+        """Timeline and media pool handles are reused too."""
+        api = ResolveAPI.get_instance()
+        assert api.timeline is api.timeline
+        assert api.media_pool is api.media_pool
+
+    def test_media_storage_survives_invalidation(self, mock_resolve) -> None:
+        """Media storage is kept across health checks and invalidations."""
+        api = ResolveAPI.get_instance()
+        storage = api.media_storage
+        api.invalidate_handles()
+        api._last_health_check = 0.0
+        assert api.media_storage is storage
+
+    def test_get_project_settings_batched(self, mock_resolve) -> None:
+        """get_project_settings() reads the keys from one cached GetSetting() dict."""
+        api = ResolveAPI.get_instance()
+        settings = api.get_project_settings(("timelineResolutionWidth", "timelineFrameRate", "bogus"))
+        assert settings == {
+            "timelineResolutionWidth": "1920",
+            "timelineFrameRate": "24",
+            "bogus": None,
+        }
+        assert api._handles["project_settings"] is not None
+
+    def test_get_project_settings_per_key_fallback(self, mock_resolve, monkeypatch) -> None:
+        """Bridges without the no-arg GetSetting() fall back to per-key reads."""
+        monkeypatch.setattr(MockProject, "GetSetting", lambda self, key: f"v-{key}")
+        api = ResolveAPI.get_instance()
+        assert api.get_project_settings(("a", "b")) == {"a": "v-a", "b": "v-b"}
+
+    def test_fetch_racing_invalidation_is_not_cached(self, mock_resolve) -> None:
+        """A handle fetched across an invalidate_handles() call is not stored."""
+        api = ResolveAPI.get_instance()
+
+        def fetch(_resolve):
+            api.invalidate_handles()  # e.g. another thread switched projects
+            return object()
+
+        first = api._cached_handle("probe", fetch)
+        assert "probe" not in api._handles
+        assert api._cached_handle("probe", lambda _r: first) is first
+        assert api._handles["probe"] is first
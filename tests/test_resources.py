@@ -42,3 +42,57 @@ async def test_timeline_info_resource(mcp_server: Client):
     assert data["audio_tracks"] == 3
     assert data["start_timecode"] == "01:00:00:00"
     assert data["current_timecode"] == "01:00:00:00"
+
+
+def test_batch_calls_preserves_order_and_raises():
+    """batch_calls returns results in call order and propagates errors."""
+    from davinci_resolve_mcp.resources._helpers import batch_calls
+
+    assert batch_calls([lambda: "a", lambda: 2, lambda: None]) == ["a", 2, None]
+
+    def boom():
+        raise RuntimeError("bridge dropped")
+
+    with pytest.raises(RuntimeError, match="bridge dropped"):
+        batch_calls([lambda: 1, boom])
+
+
+@pytest.mark.asyncio
+async def test_system_info_caches_version_per_connection(mcp_server: Client, mock_resolve):
+    """Version and product are fetched once per connection; page is always live."""
+    calls = []
+    get_version = mock_resolve.GetVersion
+    mock_resolve.GetVersion = lambda: calls.append("version") or get_version()
+    mock_resolve.GetCurrentPage = lambda: "color"
+
+    first = json.loads((await mcp_server.read_resource("resolve://system"))[0].text)
+    calls.clear()
+    second = json.loads((await mcp_server.read_resource("resolve://system"))[0].text)
+    assert first == second
+    assert second["current_page"] == "color"
+    # The health check may still probe GetVersion() but the resource does not
+    assert calls == []
+
+
+def test_compile_object_matches_dumps():
+    """compile_object output is byte-identical to dumps on the same dict."""
+    from davinci_resolve_mcp.resources._helpers import compile_object, dumps
+
+    encode = compile_object("name", "frame", "fps", "missing", "flag")
+    values = ('Tl "1" é\n', 42, 23.976, None, True)
+    assert encode(*values) == dumps(dict(zip(("name", "frame", "fps", "missing", "flag"), values)))
+
+
+@pytest.mark.asyncio
+async def test_timeline_info_stale_reference(mcp_server: Client, monkeypatch):
+    """A stale bridge reference yields the lost-connection payload."""
+    from conftest import MockTimeline
+
+    def stale(self):
+        raise AttributeError("'NoneType' object has no attribute 'GetName'")
+
+    monkeypatch.setattr(MockTimeline, "GetName", stale)
+    result = await mcp_server.read_resource("resolve://timeline")
+    data = json.loads(result[0].text)
+    assert data["error"].startswith("Lost connection to Resolve")
+    assert data["name"] is None
@@ -0,0 +1,49 @@
+"""Tests for server.py tool module selection."""
+
+from __future__ import annotations
+
+import ast
+import os
+import subprocess
+import sys
+
+import pytest
+
+from davinci_resolve_mcp import server
+
+
+def test_all_modules_by_default(monkeypatch: pytest.MonkeyPatch) -> None:
+    """With the env var unset every tool module is registered."""
+    monkeypatch.delenv(server._TOOLS_ENV, raising=False)
+    assert server._selected_tool_modules() == server._TOOL_MODULES
+
+
+def test_subset_keeps_canonical_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A comma-separated subset is honoured in registration order."""
+    monkeypatch.setenv(server._TOOLS_ENV, " color, playback ,")
+    assert server._selected_tool_modules() == ("playback", "color")
+
+
+def test_unknown_module_rejected(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A misspelt module name fails loudly instead of being ignored."""
+    monkeypatch.setenv(server._TOOLS_ENV, "playback,colour")
+    with pytest.raises(ValueError, match="colour"):
+        server._selected_tool_modules()
+
+
+def test_unlisted_modules_not_imported() -> None:
+    """Modules left out of the env var are never imported, even indirectly."""
+    code = (
+        "import sys; import davinci_resolve_mcp.server; "
+        "print(sorted(m for m in sys.modules "
+        "if m.startswith('davinci_resolve_mcp.tools.')))"
+    )
+    env = {**os.environ, server._TOOLS_ENV: "timeline_item,gallery"}
+    out = subprocess.run(
+        [sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True
+    ).stdout
+    assert ast.literal_eval(out.strip()) == [
+        "davinci_resolve_mcp.tools._helpers",
+        "davinci_resolve_mcp.tools.gallery",
+        "davinci_resolve_mcp.tools.timeline_item",
+    ]
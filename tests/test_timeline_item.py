@@ -10,6 +10,9 @@ from __future__ import annotations
 import pytest
 from fastmcp import Client
 
+from conftest import MockTimeline, MockTimelineItem
+from davinci_resolve_mcp.resolve_api import ResolveAPI
+
 
 # ---------------------------------------------------------------------------
 # Basic info
@@ -134,3 +137,97 @@ async def test_set_enabled(mcp_server: Client) -> None:
         },
     )
     assert result.data is True
+
+
+# ---------------------------------------------------------------------------
+# Item lookup index
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_repeated_lookups_scan_track_once(
+    mcp_server: Client, monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Lookups on the same track reuse the name index instead of rescanning."""
+    calls = []
+
+    def counting_list(self, track_type, index):
+        calls.append((track_type, index))
+        return [MockTimelineItem("Clip A"), MockTimelineItem("Clip B")]
+
+    monkeypatch.setattr(MockTimeline, "GetItemListInTrack", counting_list)
+
+    for name in ("Clip A", "Clip B", "Clip A"):
+        result = await mcp_server.call_tool(
+            "item_get_name",
+            {"item_name": name, "track_type": "video", "track_index": 1},
+        )
+        assert result.data == name
+    assert calls == [("video", 1)]
+
+
+@pytest.mark.asyncio
+async def test_timeline_handle_refresh_triggers_rescan(
+    mcp_server: Client, monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The index is tied to the timeline handle and rebuilt after a refresh."""
+    calls = []
+
+    def counting_list(self, track_type, index):
+        calls.append((track_type, index))
+        return [MockTimelineItem("Clip A")]
+
+    monkeypatch.setattr(MockTimeline, "GetItemListInTrack", counting_list)
+    args = {"item_name": "Clip A", "track_type": "video", "track_index": 1}
+
+    await mcp_server.call_tool("item_get_name", args)
+    # What the health check does: the next access fetches a new handle
+    ResolveAPI.get_instance().invalidate_handles()
+    await mcp_server.call_tool("item_get_name", args)
+    assert calls == [("video", 1), ("video", 1)]
+
+
+@pytest.mark.asyncio
+async def test_renamed_item_triggers_rescan(
+    mcp_server: Client, monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """An indexed item whose name changed is not returned for the old name."""
+    renamed = MockTimelineItem("Clip A")
+    monkeypatch.setattr(
+        MockTimeline, "GetItemListInTrack", lambda self, t, i: [renamed],
+    )
+    await mcp_server.call_tool(
+        "item_get_name",
+        {"item_name": "Clip A", "track_type": "video", "track_index": 1},
+    )
+
+    renamed._name = "Clip Z"
+    with pytest.raises(Exception):
+        await mcp_server.call_tool(
+            "item_get_name",
+            {"item_name": "Clip A", "track_type": "video", "track_index": 1},
+        )
+
+
+@pytest.mark.asyncio
+async def test_deleting_clips_clears_the_index(
+    mcp_server: Client, monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """After timeline_delete_clips, a lookup rescans instead of trusting the index.
+
+    The deleted item's reference can still report its name, so only the
+    rescan finds the same-named clip that replaced it.
+    """
+    calls = []
+
+    def counting_list(self, track_type, index):
+        calls.append((track_type, index))
+        return [MockTimelineItem("Clip A")]
+
+    monkeypatch.setattr(MockTimeline, "GetItemListInTrack", counting_list)
+    args = {"item_name": "Clip A", "track_type": "video", "track_index": 1}
+
+    await mcp_server.call_tool("item_get_name", args)
+    await mcp_server.call_tool("timeline_delete_clips", {"item_names": ["Clip A"]})
+    await mcp_server.call_tool("item_get_name", args)
+    # Lookup, the delete tool's own listing, then a fresh lookup scan
+    assert len(calls) == 3